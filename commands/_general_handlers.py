@@ -3,6 +3,15 @@
 from astrbot.api import logger
 from astrbot.api.event import AstrMessageEvent
 from ..core.runtime_data import runtime_data
+from ..llm.placeholder_utils import PLACEHOLDER_GROUPS
+
+# 用户信息模板支持的占位符说明（由占位符注册表派生，模块加载时生成一次）
+_USER_INFO_PLACEHOLDERS_TEXT = ", ".join(
+    "{" + token + "}"
+    for group in PLACEHOLDER_GROUPS
+    if group["key"] == "user_info"
+    for token in group["tokens"]
+)
 
 
 class GeneralHandlersMixin:
@@ -53,93 +62,100 @@ class GeneralHandlersMixin:
             proactive_config = self.config.get("proactive_reply", {})
 
             # 1. 用户信息配置
-            config_text = "📋 插件完整配置\n\n"
-            config_text += "=" * 50 + "\n"
-            config_text += "👤 用户信息附加配置\n"
-            config_text += "=" * 50 + "\n"
-            config_text += (
+            parts = ["📋 插件完整配置\n\n"]
+            parts.append("=" * 50 + "\n")
+            parts.append("👤 用户信息附加配置\n")
+            parts.append("=" * 50 + "\n")
+            parts.append(
                 f"时间格式: {user_config.get('time_format', '%Y-%m-%d %H:%M:%S')}\n"
             )
             template = user_config.get(
                 "template",
                 "当前对话信息：\\n用户：{username}\\n时间：{time}\\n平台：{platform}（{chat_type}）\\n\\n",
             )
-            config_text += (
+            parts.append(
                 f"模板: {template[:100]}{'...' if len(template) > 100 else ''}\n"
             )
-            config_text += "支持占位符: {username}, {user_id}, {time}, {current_time}, {platform}, {chat_type}, {user_last_message_time}, {user_last_message_time_ago}, {ai_last_sent_time}\n\n"
+            parts.append(f"支持占位符: {_USER_INFO_PLACEHOLDERS_TEXT}\n\n")
 
             # 2. 主动回复功能配置
-            config_text += "=" * 50 + "\n"
-            config_text += "🤖 主动回复功能配置\n"
-            config_text += "=" * 50 + "\n"
-            config_text += f"功能状态: {'✅ 已启用' if proactive_config.get('enabled', False) else '❌ 已禁用'}\n"
-            config_text += (
+            parts.append("=" * 50 + "\n")
+            parts.append("🤖 主动回复功能配置\n")
+            parts.append("=" * 50 + "\n")
+            parts.append(
+                f"功能状态: {'✅ 已启用' if proactive_config.get('enabled', False) else '❌ 已禁用'}\n"
+            )
+            parts.append(
                 f"定时模式: {proactive_config.get('timing_mode', 'fixed_interval')}\n"
             )
-            config_text += (
+            parts.append(
                 f"发送间隔: {proactive_config.get('interval_minutes', 600)} 分钟\n"
             )
-            config_text += f"睡眠时间: {self._get_sleep_time_status()}\n"
-            config_text += f"随机延迟: {'✅ 已启用' if proactive_config.get('random_delay_enabled', False) else '❌ 未启用'}\n"
+            parts.append(f"睡眠时间: {self._get_sleep_time_status()}\n")
+            parts.append(
+                f"随机延迟: {'✅ 已启用' if proactive_config.get('random_delay_enabled', False) else '❌ 未启用'}\n"
+            )
 
             if proactive_config.get("random_delay_enabled", False):
-                config_text += f"  - 随机延迟范围: {proactive_config.get('min_random_minutes', 0)}-{proactive_config.get('max_random_minutes', 30)} 分钟\n"
+                parts.append(
+                    f"  - 随机延迟范围: {proactive_config.get('min_random_minutes', 0)}-{proactive_config.get('max_random_minutes', 30)} 分钟\n"
+                )
 
             # 3. 历史记录配置
-            config_text += f"\n对话历史记录: {'✅ 已启用' if proactive_config.get('include_history_enabled', False) else '❌ 未启用'}\n"
+            parts.append(
+                f"\n对话历史记录: {'✅ 已启用' if proactive_config.get('include_history_enabled', False) else '❌ 未启用'}\n"
+            )
             if proactive_config.get("include_history_enabled", False):
-                config_text += f"  - 历史记录条数: {proactive_config.get('history_message_count', 10)} 条\n"
+                parts.append(
+                    f"  - 历史记录条数: {proactive_config.get('history_message_count', 10)} 条\n"
+                )
 
             # 4. 消息分割配置
             split_config = self.config.get("message_split", {})
-            config_text += f"\n消息分割功能: {'✅ 已启用' if split_config.get('enabled', True) else '❌ 未启用'}\n"
+            parts.append(
+                f"\n消息分割功能: {'✅ 已启用' if split_config.get('enabled', True) else '❌ 未启用'}\n"
+            )
             if split_config.get("enabled", True):
-                config_text += (
-                    f"  - 分割模式: {split_config.get('mode', 'backslash')}\n"
-                )
-                config_text += (
+                parts.append(f"  - 分割模式: {split_config.get('mode', 'backslash')}\n")
+                parts.append(
                     f"  - 分割延迟: {split_config.get('delay_ms', 500)} 毫秒\n"
                 )
 
             # 5. 会话和记录统计
             # 获取会话列表
-            from ..utils.parsers import parse_sessions_list
-
-            sessions_data = proactive_config.get("sessions", [])
-            sessions = parse_sessions_list(sessions_data)
-
-            config_text += "\n" + "=" * 50 + "\n"
-            config_text += "📊 数据统计\n"
-            config_text += "=" * 50 + "\n"
-            config_text += f"配置的会话数: {len(sessions)}\n"
-            config_text += f"记录的用户信息: {len(runtime_data.session_user_info)} 个\n"
-            config_text += (
-                f"AI发送时间记录: {len(runtime_data.ai_last_sent_times)} 条\n"
-            )
+            sessions = self.plugin.task_manager.get_target_sessions()
+
+            parts.append("\n" + "=" * 50 + "\n")
+            parts.append("📊 数据统计\n")
+            parts.append("=" * 50 + "\n")
+            parts.append(f"配置的会话数: {len(sessions)}\n")
+            parts.append(f"记录的用户信息: {len(runtime_data.session_user_info)} 个\n")
+            parts.append(f"AI发送时间记录: {len(runtime_data.ai_last_sent_times)} 条\n")
 
             # 6. 提示词配置
-            config_text += "\n" + "=" * 50 + "\n"
-            config_text += "💬 提示词配置\n"
-            config_text += "=" * 50 + "\n"
+            parts.append("\n" + "=" * 50 + "\n")
+            parts.append("💬 提示词配置\n")
+            parts.append("=" * 50 + "\n")
 
             # 获取基础人格提示词
             base_prompt = await self.plugin.prompt_builder.get_base_system_prompt()
-            config_text += f"基础人格提示词长度: {len(base_prompt)} 字符\n"
-            config_text += f"基础人格提示词预览:\n{base_prompt[:200]}{'...' if len(base_prompt) > 200 else ''}\n\n"
+            parts.append(f"基础人格提示词长度: {len(base_prompt)} 字符\n")
+            parts.append(
+                f"基础人格提示词预览:\n{base_prompt[:200]}{'...' if len(base_prompt) > 200 else ''}\n\n"
+            )
 
             # 主动对话提示词列表
             prompt_list = proactive_config.get("proactive_prompt_list", [])
-            config_text += f"主动对话提示词数量: {len(prompt_list)} 条\n"
+            parts.append(f"主动对话提示词数量: {len(prompt_list)} 条\n")
 
             # 备用人格
             default_persona = proactive_config.get("proactive_default_persona", "")
             if default_persona:
-                config_text += f"\n插件备用人格长度: {len(default_persona)} 字符\n"
+                parts.append(f"\n插件备用人格长度: {len(default_persona)} 字符\n")
 
-            config_text += "\n💡 使用 /proactive show prompt 查看所有主动对话提示词"
+            parts.append("\n💡 使用 /proactive show prompt 查看所有主动对话提示词")
 
-            yield event.plain_result(config_text)
+            yield event.plain_result("".join(parts))
 
         except Exception as e:
             logger.error(f"心念 | ❌ 显示配置失败: {e}")
@@ -1,6 +1,5 @@
 """功能管理与调试命令"""
 
-import asyncio
 from astrbot.api.event import AstrMessageEvent
 from ..core.runtime_data import runtime_data
 
@@ -108,9 +107,7 @@ class ManageHandlersMixin:
         """强制启动"""
         try:
             await self.plugin.task_manager.stop_proactive_task()
-            self.plugin.task_manager.proactive_task = asyncio.create_task(
-                self.plugin.task_manager.proactive_message_loop()
-            )
+            self.plugin.task_manager.spawn_proactive_loop()
             yield event.plain_result("✅ 已强制启动任务")
         except Exception as e:
             yield event.plain_result(f"❌ 启动失败: {e}")
@@ -3,6 +3,8 @@
 from astrbot.api import logger
 from astrbot.api.event import AstrMessageEvent
 
+from ..utils.parsers import parse_sessions_list
+
 
 class SessionHandlersMixin:
     """会话管理命令"""
@@ -11,7 +13,9 @@ class SessionHandlersMixin:
         """添加当前会话到主动对话列表"""
         try:
             session_id = event.unified_msg_origin
-            sessions = self.config.get("proactive_reply", {}).get("sessions", [])
+            sessions = parse_sessions_list(
+                self.config.get("proactive_reply", {}).get("sessions", [])
+            )
 
             if session_id in sessions:
                 yield event.plain_result("当前会话已在主动对话列表中")
@@ -32,7 +36,9 @@ class SessionHandlersMixin:
         """从主动对话列表移除当前会话"""
         try:
             session_id = event.unified_msg_origin
-            sessions = self.config.get("proactive_reply", {}).get("sessions", [])
+            sessions = parse_sessions_list(
+                self.config.get("proactive_reply", {}).get("sessions", [])
+            )
 
             if session_id in sessions:
                 sessions.remove(session_id)
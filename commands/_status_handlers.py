@@ -23,11 +23,9 @@ class StatusHandlersMixin:
             user_config = self.config.get("user_info", {})
             proactive_config = self.config.get("proactive_reply", {})
 
-            sessions_data = proactive_config.get("sessions", [])
-            from ..utils.parsers import parse_sessions_list
-
-            sessions = parse_sessions_list(sessions_data)
-            session_count = len(sessions)
+            # 复用任务管理器的会话解析缓存（已去重，附带集合查找）
+            task_manager = self.plugin.task_manager
+            session_count = len(task_manager.get_target_sessions())
 
             # 获取用户信息记录数量（从运行时数据存储）
             user_info_count = len(runtime_data.session_user_info)
@@ -46,12 +44,12 @@ class StatusHandlersMixin:
                 llm_available = provider_id is not None
             except Exception:
                 llm_available = False
-            is_current_in_list = current_session in sessions
+            is_current_in_list = task_manager.is_target_session(current_session)
 
             # 获取各会话的下次发送时间信息
             next_fire_info = ""
             if proactive_config.get("enabled", False) and session_count > 0:
-                sessions_status = self.plugin.task_manager.get_all_sessions_status()
+                sessions_status = task_manager.get_all_sessions_status()
                 if sessions_status:
                     next_fire_info = "\n\n⏱️ 各会话下次发送时间："
                     for sess, info in sessions_status[:5]:  # 最多显示5个
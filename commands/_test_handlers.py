@@ -111,14 +111,12 @@ class TestHandlersMixin:
             proactive_config = self.config.get("proactive_reply", {})
 
             # 1. 获取并选择提示词
-            from ..utils.parsers import parse_prompt_list
-
             prompt_list_data = proactive_config.get("proactive_prompt_list", [])
             if not prompt_list_data:
                 yield event.plain_result("❌ 未配置主动对话提示词列表")
                 return
 
-            prompt_list = parse_prompt_list(prompt_list_data)
+            prompt_list = self.plugin.prompt_builder.get_prompt_list(prompt_list_data)
             if not prompt_list:
                 yield event.plain_result("❌ 主动对话提示词列表为空")
                 return
@@ -198,6 +196,9 @@ class TestHandlersMixin:
             time_guidance_info = "✅ 已启用" if time_guidance_enabled else "❌ 未启用"
 
             # 8. 构建详细的输出信息
+            history_preview_text = (
+                f"  - 历史预览:\n{history_preview}" if history_preview else ""
+            )
             result_text = f"""🧪 系统提示词构建测试（与实际LLM调用一致）
 
 📝 原始提示词：
@@ -217,7 +218,7 @@ class TestHandlersMixin:
   - 状态: {history_info}
   - 配置条数: {history_count} 条
   - 传递方式: contexts 参数（非系统提示词内嵌）
-{f"  - 历史预览:{chr(10)}{history_preview}" if history_preview else ""}
+{history_preview_text}
 
 📜 历史引导语：
 {history_guidance if history_guidance else "(无 - 未启用或无历史记录)"}
@@ -12,6 +12,15 @@ MIN_HISTORY_MESSAGE_COUNT = 1
 MAX_HISTORY_MESSAGE_COUNT = 50
 
 
+# ==================== 主动消息发送 ====================
+
+# 单次 LLM 调用（生成主动消息 / 调度分析）的超时秒数。
+# 超时发生在任何内容送达之前，由发送重试逻辑重新生成。
+LLM_GENERATE_TIMEOUT_SECONDS = 180
+# 单次平台发送调用的超时秒数。超时后不重试，避免消息实际已送达时重复发送。
+PLATFORM_SEND_TIMEOUT_SECONDS = 60
+
+
 # ==================== 消息分割 / 正则保护 ====================
 
 # 参与正则分割的文本长度上限。超过该长度则跳过基于正则的分割、整条发送，
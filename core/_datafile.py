@@ -120,13 +120,33 @@ def atomic_write_yaml(path: str, data: dict, header: str | None = None) -> bool:
         data: 待写入的字典
         header: 可选的头部注释
 
+    Returns:
+        是否写入成功
+    """
+    try:
+        text = dump_yaml_str(data, header=header)
+    except Exception as e:
+        logger.error(f"心念 | ❌ 序列化 YAML 失败: {path}: {e}")
+        return False
+    return atomic_write_text(path, text)
+
+
+def atomic_write_text(path: str, text: str) -> bool:
+    """原子性地写入文本文件（先写临时文件再重命名）
+
+    只做文件 IO，可放到线程中执行。
+
+    Args:
+        path: 目标文件路径
+        text: 待写入的文本
+
     Returns:
         是否写入成功
     """
     temp_file = path + ".tmp"
     try:
         with open(temp_file, "w", encoding="utf-8") as f:
-            f.write(dump_yaml_str(data, header=header))
+            f.write(text)
 
         # Windows 下 os.rename 不允许覆盖已存在文件
         if os.name == "nt" and os.path.exists(path):
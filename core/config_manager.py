@@ -6,11 +6,13 @@
 注意：默认配置从 _conf_schema.json 动态读取，确保单一数据源
 """
 
+import copy
 import json
 import os
 from typing import Callable, Optional
 from astrbot.api import logger
 from .runtime_data import runtime_data
+from ..utils.parsers import parse_sessions_list
 
 
 class ConfigManager:
@@ -124,11 +126,14 @@ class ConfigManager:
         except TypeError as e:
             logger.error(f"心念 | ❌ 配置数据类型错误: {e}")
 
-    def _clean_runtime_data_from_config(self):
+    def _clean_runtime_data_from_config(self) -> bool:
         """从配置中清理运行时数据字段
 
         这些字段不应该显示在 AstrBot 配置界面中，
         它们通过 PersistenceManager 独立存储在 persistent_data.json 中。
+
+        Returns:
+            是否清理了字段（由调用方统一保存配置）
         """
         proactive_config = self.config.get("proactive_reply", {})
         cleaned = False
@@ -140,17 +145,57 @@ class ConfigManager:
                 logger.debug(f"心念 | 已从配置中移除运行时数据字段: {key}")
 
         if cleaned:
-            try:
-                self.config.save_config()
-                logger.info("心念 | ✅ 已清理配置中的运行时数据字段")
-            except Exception as e:
-                logger.warning(f"心念 | ⚠️ 保存清理后的配置失败: {e}")
+            logger.info("心念 | ✅ 已清理配置中的运行时数据字段")
+        return cleaned
+
+    def _normalize_sessions_list(self) -> bool:
+        """将旧版字符串格式（JSON/换行分隔）的会话配置一次性转换为列表
+
+        转换后配置中始终保存列表，读取与增删会话时无需再拆分/拼接字符串。
+
+        Returns:
+            是否转换了配置（由调用方统一保存配置）
+        """
+        proactive_config = self.config.get("proactive_reply")
+        if not isinstance(proactive_config, dict):
+            return False
+        sessions_data = proactive_config.get("sessions")
+        if not isinstance(sessions_data, str):
+            return False
+
+        proactive_config["sessions"] = parse_sessions_list(sessions_data)
+        logger.info("心念 | ✅ 已将旧版字符串格式的会话列表转换为列表格式")
+        return True
+
+    def _fill_missing_defaults(self) -> bool:
+        """单次遍历补全缺失的配置项
+
+        默认值取自 schema 缓存，写入前深拷贝，避免配置与缓存共享可变对象。
+
+        Returns:
+            是否补全了配置项
+        """
+        updated = False
+        for section, section_defaults in self.DEFAULT_CONFIG.items():
+            section_config = self.config.get(section)
+            if section_config is None:
+                self.config[section] = copy.deepcopy(section_defaults)
+                updated = True
+                continue
+            for key, default_value in section_defaults.items():
+                if key not in section_config:
+                    section_config[key] = copy.deepcopy(default_value)
+                    updated = True
+        return updated
 
     def ensure_config_structure(self):
-        """确保配置文件结构完整"""
+        """确保配置文件结构完整
+
+        清理运行时字段与补全默认值合并为一次保存；配置无变化时不写文件。
+        """
         # 清理不应该在配置界面显示的运行时数据字段
         # 这些数据通过 PersistenceManager 独立存储，不需要在 AstrBot 配置中
-        self._clean_runtime_data_from_config()
+        config_updated = self._clean_runtime_data_from_config()
 
         # 加载持久化数据到 RuntimeDataStore
         if self.persistence_manager:
@@ -159,18 +204,12 @@ class ConfigManager:
         # 数据迁移（必须在默认值补全之前执行，否则新分组被默认值填充后迁移条件永远不满足）
         self.migrate_time_records()
 
+        if self._normalize_sessions_list():
+            config_updated = True
+
         # 检查并补充缺失的配置
-        config_updated = False
-        for section, section_config in self.DEFAULT_CONFIG.items():
-            if section not in self.config:
-                self.config[section] = section_config
-                config_updated = True
-            else:
-                # 检查子配置项
-                for key, default_value in section_config.items():
-                    if key not in self.config[section]:
-                        self.config[section][key] = default_value
-                        config_updated = True
+        if self._fill_missing_defaults():
+            config_updated = True
 
         # 如果配置有更新，保存配置文件
         if config_updated:
@@ -5,10 +5,11 @@
 """
 
 import json
+import logging
 from astrbot.api import logger
 from .runtime_data import runtime_data
 from ..llm.placeholder_utils import replace_placeholders
-from ..utils.time_utils import get_now
+from ..utils.time_utils import format_now
 
 
 class ConversationManager:
@@ -52,9 +53,7 @@ class ConversationManager:
         proactive_config = self.config.get("proactive_reply", {})
         history_save_mode = proactive_config.get("history_save_mode", "default")
 
-        current_time = get_now(self.config, self._get_astrbot_config()).strftime(
-            "%Y-%m-%d %H:%M:%S"
-        )
+        current_time = format_now(self.config, self._get_astrbot_config())
         unreplied_count = runtime_data.session_unreplied_count.get(session, 0)
 
         if history_save_mode == "proactive_prompt":
@@ -192,14 +191,17 @@ class ConversationManager:
                                 {"role": role, "content": combined_content}
                             )
                         else:
-                            logger.debug(
-                                f"心念 | 历史记录第 {idx} 条: 列表格式但无可提取文本, content={content}"
-                            )
+                            # 逐条日志会格式化完整 content，仅在 DEBUG 启用时构建
+                            if logger.isEnabledFor(logging.DEBUG):
+                                logger.debug(
+                                    f"心念 | 历史记录第 {idx} 条: 列表格式但无可提取文本, content={content}"
+                                )
                             skipped_count += 1
                     else:
-                        logger.debug(
-                            f"心念 | 历史记录第 {idx} 条: 未知 content 类型 {type(content)}"
-                        )
+                        if logger.isEnabledFor(logging.DEBUG):
+                            logger.debug(
+                                f"心念 | 历史记录第 {idx} 条: 未知 content 类型 {type(content)}"
+                            )
                         skipped_count += 1
 
                 if skipped_count > 0:
@@ -4,14 +4,23 @@
 负责数据的持久化存储和加载
 """
 
+import asyncio
 import datetime
 import json
 import os
 import shutil
+import threading
+from typing import Optional
 from astrbot.api import logger
 from astrbot.api.star import StarTools
 from ..utils.validators import validate_persistent_data
-from ._datafile import atomic_write_yaml, load_mapping, migrate_json_to_yaml
+from ._datafile import (
+    atomic_write_text,
+    atomic_write_yaml,
+    dump_yaml_str,
+    load_mapping,
+    migrate_json_to_yaml,
+)
 from .runtime_data import runtime_data
 
 # 插件数据目录名(与 metadata.yaml 中的 name 保持一致)
@@ -21,6 +30,9 @@ PLUGIN_DATA_DIR_NAME = "astrbot_proactive_reply"
 PERSISTENT_FILE_NAME = "persistent_data.yaml"
 LEGACY_PERSISTENT_FILE_NAME = "persistent_data.json"
 
+# 合并写入的防抖延迟（秒）：该时间窗口内的多次数据变更只落盘一次
+SAVE_DEBOUNCE_SECONDS = 2.0
+
 
 class PersistenceManager:
     """持久化管理器类"""
@@ -34,6 +46,13 @@ class PersistenceManager:
         """
         self.config = config
         self.context = context
+        # 合并写入状态：有待保存的变更 / 正在等待落盘的后台任务
+        self._dirty = False
+        self._save_task: Optional[asyncio.Task] = None
+        # 写盘互斥与快照序号：保证线程写入与同步写入不会交错或以旧覆新
+        self._write_lock = threading.Lock()
+        self._snapshot_seq = 0
+        self._written_seq = 0
 
     def get_plugin_data_dir(self) -> str:
         """获取插件专用的数据目录路径
@@ -274,6 +293,48 @@ class PersistenceManager:
         except Exception as e:
             logger.error(f"心念 | ❌ 迁移旧持久化数据失败: {e}")
 
+    def _prepare_persistent_text(self) -> Optional[tuple]:
+        """在事件循环线程中生成持久化快照并序列化为 YAML 文本
+
+        Returns:
+            (序号, 文件路径, YAML 文本)，数据验证失败返回 None
+        """
+        plugin_data_dir = self.get_plugin_data_dir()
+        persistent_file = os.path.join(plugin_data_dir, PERSISTENT_FILE_NAME)
+
+        # 从运行时数据存储中获取数据（session-major 嵌套格式，更直观）
+        persistent_data = runtime_data.to_persistent_dict()
+        persistent_data["meta"]["last_update"] = datetime.datetime.now().strftime(
+            "%Y-%m-%d %H:%M:%S"
+        )
+        persistent_data["meta"]["data_version"] = "3.1"
+
+        if not validate_persistent_data(persistent_data):
+            logger.error("心念 | ❌ 持久化数据验证失败")
+            return None
+
+        text = dump_yaml_str(
+            persistent_data,
+            header="心念插件持久化数据（自动生成，一般无需手动编辑）",
+        )
+        self._snapshot_seq += 1
+        return self._snapshot_seq, persistent_file, text
+
+    def _write_persistent_text(self, seq: int, path: str, text: str) -> bool:
+        """写入持久化文本（可在线程中执行）
+
+        若已有更新的快照先落盘，则跳过这次较旧的写入，避免新数据被覆盖。
+        """
+        with self._write_lock:
+            if seq < self._written_seq:
+                return True
+            ok = atomic_write_text(path, text)
+            if ok:
+                self._written_seq = seq
+        if ok:
+            logger.debug(f"心念 | ✅ 持久化数据已保存到: {path}")
+        return ok
+
     def save_persistent_data(self) -> bool:
         """保存用户数据到独立的持久化文件
 
@@ -281,33 +342,72 @@ class PersistenceManager:
             是否保存成功
         """
         try:
-            plugin_data_dir = self.get_plugin_data_dir()
-            persistent_file = os.path.join(plugin_data_dir, PERSISTENT_FILE_NAME)
-
-            # 从运行时数据存储中获取数据（session-major 嵌套格式，更直观）
-            persistent_data = runtime_data.to_persistent_dict()
-            persistent_data["meta"]["last_update"] = datetime.datetime.now().strftime(
-                "%Y-%m-%d %H:%M:%S"
-            )
-            persistent_data["meta"]["data_version"] = "3.1"
-
-            if not validate_persistent_data(persistent_data):
-                logger.error("心念 | ❌ 持久化数据验证失败")
+            prepared = self._prepare_persistent_text()
+            if prepared is None:
                 return False
+            return self._write_persistent_text(*prepared)
+        except Exception as e:
+            logger.error(f"心念 | ❌ 持久化数据保存错误: {e}")
+            return False
 
-            ok = atomic_write_yaml(
-                persistent_file,
-                persistent_data,
-                header="心念插件持久化数据（自动生成，一般无需手动编辑）",
-            )
-            if ok:
-                logger.debug(f"心念 | ✅ 持久化数据已保存到: {persistent_file}")
-            return ok
+    async def save_persistent_data_async(self) -> bool:
+        """保存用户数据，文件写入放到线程中执行，不阻塞事件循环
+
+        快照与序列化仍在事件循环线程完成，避免与运行时数据的修改并发。
 
+        Returns:
+            是否保存成功
+        """
+        try:
+            prepared = self._prepare_persistent_text()
+            if prepared is None:
+                return False
+            return await asyncio.to_thread(self._write_persistent_text, *prepared)
         except Exception as e:
             logger.error(f"心念 | ❌ 持久化数据保存错误: {e}")
             return False
 
+    def schedule_save(self) -> bool:
+        """标记数据待保存，在防抖延迟后合并写入
+
+        适用于按消息频率触发的高频记录；短时间内的多次调用只会落盘一次。
+        没有运行中的事件循环时（如同步初始化阶段）直接同步保存。
+
+        Returns:
+            是否已排期保存（或同步保存成功）
+        """
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return self.save_persistent_data()
+
+        self._dirty = True
+        if self._save_task is None or self._save_task.done():
+            self._save_task = loop.create_task(self._flush_loop())
+        return True
+
+    async def _flush_loop(self):
+        """防抖落盘循环：等待窗口期结束后写入，直到没有新的变更"""
+        while self._dirty:
+            await asyncio.sleep(SAVE_DEBOUNCE_SECONDS)
+            self._dirty = False
+            await self.save_persistent_data_async()
+
+    async def flush_pending_save(self):
+        """立即写入尚未落盘的变更（插件终止时调用）"""
+        task = self._save_task
+        self._save_task = None
+        if task is not None and not task.done():
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+
+        if self._dirty:
+            self._dirty = False
+            self.save_persistent_data()
+
     def load_data(self, key: str, default=None):
         """加载特定的运行时数据"""
         if key == "user_info":
@@ -5,6 +5,7 @@
 """
 
 import datetime
+from typing import Optional
 from astrbot.api import logger
 from astrbot.api.event import AstrMessageEvent
 from .runtime_data import runtime_data
@@ -17,8 +18,10 @@ from ..llm.placeholder_utils import (
     render_template,
     resolve_event_identity,
     stabilize_static_prompt_template,
+    template_tokens,
 )
 from ..utils.time_utils import (
+    format_now,
     get_now,
     get_sleep_prompt_if_active as _check_sleep_prompt,
 )
@@ -26,6 +29,26 @@ from ..utils.time_utils import (
 # 用户信息模板默认值（占位符由统一注册表解析）
 DEFAULT_USER_INFO_TEMPLATE = "当前对话信息：\n用户：{username}\n时间：{time}\n平台：{platform}（{chat_type}）\n\n"
 
+# TextPart 类的解析结果缓存（None 表示尚未解析，False 表示当前 AstrBot 不可用）
+_text_part_cls = None
+
+
+def _get_text_part_cls():
+    """解析并缓存 AstrBot 的 TextPart 类，避免在每次 LLM 请求时重复导入
+
+    Returns:
+        TextPart 类，无法导入时返回 None
+    """
+    global _text_part_cls
+    if _text_part_cls is None:
+        try:
+            from astrbot.core.agent.message import TextPart
+
+            _text_part_cls = TextPart
+        except ImportError:
+            _text_part_cls = False
+    return _text_part_cls or None
+
 
 class UserInfoManager:
     """用户信息管理器类"""
@@ -70,33 +93,21 @@ class UserInfoManager:
         time_format = user_config.get("time_format", "%Y-%m-%d %H:%M:%S")
         astrbot_config = self._get_astrbot_config()
         session_id = event.unified_msg_origin
+        # 身份信息只解析一次，模板渲染与用户信息记录共用
+        identity = resolve_event_identity(event)
 
         # 构建用户信息字符串（占位符由统一注册表解析）
         template = user_config.get("template", DEFAULT_USER_INFO_TEMPLATE)
-        try:
-            mapping = build_placeholder_map(
-                session_id,
-                self.config,
-                astrbot_config,
-                event=event,
-                time_format=time_format,
-                build_user_context_func=self.build_user_context_for_proactive,
+        if not isinstance(template, str) or not template.strip():
+            # 模板被清空：不构建占位符映射，也不注入空的附带信息
+            user_info = ""
+        elif not template_tokens(template):
+            # 模板不含占位符：原样使用，跳过身份/时间等占位符取值
+            user_info = template
+        else:
+            user_info = self._render_user_info(
+                template, session_id, astrbot_config, event, time_format, identity
             )
-            user_info = render_template(template, mapping)
-        except Exception as e:
-            logger.warning(f"心念 | ⚠️ 用户信息模板格式错误: {e}，使用默认模板")
-            try:
-                fallback_map = build_placeholder_map(
-                    session_id,
-                    self.config,
-                    astrbot_config,
-                    event=event,
-                    time_format=time_format,
-                )
-                user_info = render_template(DEFAULT_USER_INFO_TEMPLATE, fallback_map)
-            except Exception as fallback_error:
-                logger.error(f"心念 | ❌ 构建默认用户信息失败: {fallback_error}")
-                user_info = ""
 
         # 获取时间感知增强提示词配置
         time_awareness_config = self.config.get("time_awareness", {})
@@ -120,31 +131,77 @@ class UserInfoManager:
 
         # 固定提示词放在 system_prompt 末尾，条件性上下文放在本轮用户消息后。
         self._append_static_system_prompt(req, "\n\n".join(static_system_prompts))
-        self._prepend_dynamic_user_content(req, user_info)
+        if user_info:
+            self._prepend_dynamic_user_content(req, user_info)
         if sleep_prompt:
             self._append_dynamic_user_content(req, sleep_prompt)
 
         # 记录用户信息
-        self.record_user_info(event)
+        self.record_user_info(event, identity)
+
+    def _render_user_info(
+        self,
+        template: str,
+        session_id: str,
+        astrbot_config,
+        event,
+        time_format: str,
+        identity: Optional[dict] = None,
+    ) -> str:
+        """渲染用户信息模板，模板出错时回退到默认模板
+
+        Returns:
+            渲染后的用户信息，失败时返回空字符串
+        """
+        try:
+            # 只计算模板实际使用的占位符（如 {user_context} 取值代价较高）
+            mapping = build_placeholder_map(
+                session_id,
+                self.config,
+                astrbot_config,
+                event=event,
+                time_format=time_format,
+                build_user_context_func=self.build_user_context_for_proactive,
+                tokens=template_tokens(template),
+                identity=identity,
+            )
+            return render_template(template, mapping)
+        except Exception as e:
+            logger.warning(f"心念 | ⚠️ 用户信息模板格式错误: {e}，使用默认模板")
+            try:
+                fallback_map = build_placeholder_map(
+                    session_id,
+                    self.config,
+                    astrbot_config,
+                    event=event,
+                    time_format=time_format,
+                    identity=identity,
+                )
+                return render_template(DEFAULT_USER_INFO_TEMPLATE, fallback_map)
+            except Exception as fallback_error:
+                logger.error(f"心念 | ❌ 构建默认用户信息失败: {fallback_error}")
+                return ""
 
-    def record_user_info(self, event: AstrMessageEvent):
+    def record_user_info(
+        self, event: AstrMessageEvent, identity: Optional[dict] = None
+    ):
         """记录用户信息到运行时数据存储
 
         Args:
             event: 消息事件（用户名/ID/平台/聊天类型由统一身份解析得出）
+            identity: 已解析的身份信息（可选），提供时不再重复解析事件
         """
         try:
             session_id = event.unified_msg_origin
-            current_time = get_now(self.config, self._get_astrbot_config()).strftime(
-                "%Y-%m-%d %H:%M:%S"
-            )
+            current_time = format_now(self.config, self._get_astrbot_config())
 
             if not session_id:
                 logger.warning("心念 | ⚠️ 会话ID为空，跳过用户信息记录")
                 return
 
             # 记录用户信息到运行时数据存储
-            identity = resolve_event_identity(event)
+            if identity is None:
+                identity = resolve_event_identity(event)
             user_info = {
                 "username": identity["username"],
                 "user_id": identity["user_id"],
@@ -158,8 +215,8 @@ class UserInfoManager:
             # 用户回复后重置未回复计数
             runtime_data.session_unreplied_count[session_id] = 0
 
-            # 保存持久化数据
-            persistent_saved = self.persistence_manager.save_persistent_data()
+            # 保存持久化数据（合并写入，避免每条消息都同步落盘）
+            persistent_saved = self.persistence_manager.schedule_save()
 
             if not persistent_saved:
                 logger.error("心念 | ❌ 用户信息保存失败")
@@ -175,9 +232,7 @@ class UserInfoManager:
         """
         try:
             session_id = event.unified_msg_origin
-            current_time = get_now(self.config, self._get_astrbot_config()).strftime(
-                "%Y-%m-%d %H:%M:%S"
-            )
+            current_time = format_now(self.config, self._get_astrbot_config())
 
             if not session_id:
                 logger.warning("心念 | ⚠️ 会话ID为空，跳过AI消息时间记录")
@@ -186,8 +241,8 @@ class UserInfoManager:
             # 记录AI发送消息时间到运行时数据存储
             runtime_data.ai_last_sent_times[session_id] = current_time
 
-            # 保存持久化数据
-            persistent_saved = self.persistence_manager.save_persistent_data()
+            # 保存持久化数据（合并写入，避免每条消息都同步落盘）
+            persistent_saved = self.persistence_manager.schedule_save()
 
             if not persistent_saved:
                 logger.warning("心念 | ⚠️ AI消息时间记录保存失败")
@@ -202,9 +257,7 @@ class UserInfoManager:
             session: 会话ID
         """
         try:
-            current_time = get_now(self.config, self._get_astrbot_config()).strftime(
-                "%Y-%m-%d %H:%M:%S"
-            )
+            current_time = format_now(self.config, self._get_astrbot_config())
 
             if not session:
                 logger.warning("心念 | ⚠️ 会话ID为空，跳过发送时间记录")
@@ -218,8 +271,8 @@ class UserInfoManager:
             current_count = runtime_data.session_unreplied_count.get(session, 0)
             runtime_data.session_unreplied_count[session] = current_count + 1
 
-            # 保存持久化数据
-            persistent_saved = self.persistence_manager.save_persistent_data()
+            # 保存持久化数据（合并写入，避免每条消息都同步落盘）
+            persistent_saved = self.persistence_manager.schedule_save()
 
             if not persistent_saved:
                 logger.error("心念 | ❌ 发送时间保存失败")
@@ -265,9 +318,7 @@ class UserInfoManager:
                 context_parts.append("这是AI第一次主动发起对话")
 
             # 添加当前时间
-            current_time = get_now(self.config, self._get_astrbot_config()).strftime(
-                "%Y-%m-%d %H:%M:%S"
-            )
+            current_time = format_now(self.config, self._get_astrbot_config())
             context_parts.append(f"当前时间：{current_time}")
 
             if context_parts:
@@ -332,9 +383,8 @@ class UserInfoManager:
     def _insert_dynamic_user_content(
         self, req, additional_prompt: str, index: int
     ) -> None:
-        try:
-            from astrbot.core.agent.message import TextPart
-        except ImportError:
+        TextPart = _get_text_part_cls()
+        if TextPart is None:
             logger.warning("心念 | ⚠️ 无法导入 TextPart，跳过附带信息注入")
             return
 
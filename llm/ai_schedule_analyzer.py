@@ -6,6 +6,7 @@ AI 自主调度分析器
 """
 
 import json
+import logging
 import re
 import uuid
 from datetime import datetime, timedelta
@@ -38,6 +39,12 @@ _TIME_KEYWORD_PATTERNS = [
 # 编译为单个正则（任意一个命中即可）
 _TIME_KEYWORDS_RE = re.compile("|".join(_TIME_KEYWORD_PATTERNS))
 
+# "有点"、"吃一点" 等数量词用法（非时间点）
+_CASUAL_YIDIAN_RE = re.compile(r"(?:有|吃|喝|来)一点(?!钟|分|半|见|睡|去)")
+
+# 从第一个 "{" 起解析一个完整 JSON 对象，忽略前后的代码块标记等多余内容
+_JSON_DECODER = json.JSONDecoder()
+
 
 def contains_time_keywords(text: str) -> bool:
     """检查文本是否包含时间约定相关的关键词
@@ -63,7 +70,7 @@ def contains_time_keywords(text: str) -> bool:
     # 正则中已经尝试排除，但"一点"作为时间点(1:00)和数量词很难区分
     # 如果"一点"后面没有"钟"或"分"或"半"，且前面有"有"或"吃"等动词，则排除
     # 例: "有点咸" -> 排除; "一点见" -> 保留
-    if re.search(r"(?:有|吃|喝|来)一点(?!钟|分|半|见|睡|去)", text):
+    if _CASUAL_YIDIAN_RE.search(text):
         return False
 
     return True
@@ -84,12 +91,13 @@ def parse_schedule_response(response_text: str) -> Optional[dict]:
 
     try:
         # 尝试从文本中提取 JSON（处理 LLM 可能添加的多余内容）
-        json_match = re.search(r"\{[^}]+\}", response_text, re.DOTALL)
-        if not json_match:
+        # raw_decode 按 JSON 语法确定对象结尾，提示词中含 "}" 也能正确解析
+        start = response_text.find("{")
+        if start < 0:
             logger.warning(f"心念 | ⚠️ AI 调度响应中未找到 JSON: {response_text[:200]}")
             return None
 
-        data = json.loads(json_match.group())
+        data, _ = _JSON_DECODER.raw_decode(response_text, start)
 
         delay_minutes = data.get("delay_minutes", 0)
         follow_up_prompt = data.get("follow_up_prompt", "")
@@ -217,7 +225,8 @@ async def analyze_for_schedule(
             logger.warning("心念 | ⚠️ 调度分析 LLM 返回空响应")
             return None
 
-        logger.debug(f"心念 | 调度分析 LLM 原始响应: {response_text}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"心念 | 调度分析 LLM 原始响应: {response_text}")
 
         # 阶段2：解析 JSON 结果
         result = parse_schedule_response(response_text)
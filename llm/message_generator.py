@@ -5,11 +5,17 @@
 """
 
 import asyncio
+import logging
 from datetime import datetime
 from astrbot.api import logger
 from astrbot.api.event import MessageChain
 
-from ..constants import MAX_HISTORY_MESSAGE_COUNT, MIN_HISTORY_MESSAGE_COUNT
+from ..constants import (
+    LLM_GENERATE_TIMEOUT_SECONDS,
+    MAX_HISTORY_MESSAGE_COUNT,
+    MIN_HISTORY_MESSAGE_COUNT,
+    PLATFORM_SEND_TIMEOUT_SECONDS,
+)
 from ..core.runtime_data import runtime_data
 from ..utils.time_utils import get_tz
 from .ai_schedule_analyzer import analyze_for_schedule
@@ -204,7 +210,7 @@ class MessageGenerator:
                 )
                 # 记录历史记录获取结果
                 logger.info(f"心念 | 📚 获取到 {len(contexts)} 条历史记录")
-                if contexts:
+                if contexts and logger.isEnabledFor(logging.DEBUG):
                     last_msg = contexts[-1]
                     content_preview = last_msg.get("content", "")[:80]
                     logger.debug(
@@ -228,11 +234,15 @@ class MessageGenerator:
             logger.debug(
                 f"心念 | 调用 LLM 生成主动消息, contexts 数量: {len(contexts)}"
             )
-            llm_response = await self.context.llm_generate(
-                chat_provider_id=provider_id,
-                prompt=final_prompt,
-                contexts=contexts,
-                system_prompt=combined_system_prompt,
+            # 超时只约束 LLM 调用本身：此时尚未发送任何内容，可安全重试
+            llm_response = await asyncio.wait_for(
+                self.context.llm_generate(
+                    chat_provider_id=provider_id,
+                    prompt=final_prompt,
+                    contexts=contexts,
+                    system_prompt=combined_system_prompt,
+                ),
+                timeout=LLM_GENERATE_TIMEOUT_SECONDS,
             )
 
             if llm_response and llm_response.role == "assistant":
@@ -293,11 +303,15 @@ class MessageGenerator:
                 session, message, original_message, proactive_prompt_used
             )
 
-            # AI 自主调度分析（发送后异步执行，不影响发送本身）
-            schedule_result = await self.analyze_message_for_schedule(
-                session, original_message
-            )
-            return schedule_result
+            # AI 自主调度分析（发送后执行，不影响发送本身）
+            # 消息已送达，分析失败不能向上抛出，否则会被当作发送失败而重发
+            try:
+                return await self.analyze_message_for_schedule(
+                    session, original_message
+                )
+            except Exception as e:
+                logger.error(f"心念 | ❌ 会话 {session} 的 AI 调度分析失败: {e}")
+                return None
 
         except Exception as e:
             logger.error(f"心念 | ❌ 向会话 {session} 发送主动消息时发生错误: {e}")
@@ -359,16 +373,19 @@ class MessageGenerator:
             # 兼容旧版 dict 格式
             existing_tasks = [existing_tasks] if existing_tasks else []
 
-        return await analyze_for_schedule(
-            context=self.context,
-            provider_id=provider_id,
-            ai_message=message,
-            contexts=contexts,
-            analysis_prompt=analysis_prompt,
-            current_time_str=current_time_str,
-            schedule_provider_id=schedule_provider_id,
-            existing_tasks=existing_tasks,
-            tz=tz,
+        return await asyncio.wait_for(
+            analyze_for_schedule(
+                context=self.context,
+                provider_id=provider_id,
+                ai_message=message,
+                contexts=contexts,
+                analysis_prompt=analysis_prompt,
+                current_time_str=current_time_str,
+                schedule_provider_id=schedule_provider_id,
+                existing_tasks=existing_tasks,
+                tz=tz,
+            ),
+            timeout=LLM_GENERATE_TIMEOUT_SECONDS,
         )
 
     async def _send_message_with_split(
@@ -437,8 +454,9 @@ class MessageGenerator:
                 for i, part in enumerate(message_parts, 1):
                     try:
                         message_chain = MessageChain().message(part)
-                        success = await self.context.send_message(
-                            session, message_chain
+                        success = await asyncio.wait_for(
+                            self.context.send_message(session, message_chain),
+                            timeout=PLATFORM_SEND_TIMEOUT_SECONDS,
                         )
 
                         if success:
@@ -491,7 +509,10 @@ class MessageGenerator:
             proactive_prompt_used: 本次使用的主动对话提示词
         """
         message_chain = MessageChain().message(message)
-        success = await self.context.send_message(session, message_chain)
+        success = await asyncio.wait_for(
+            self.context.send_message(session, message_chain),
+            timeout=PLATFORM_SEND_TIMEOUT_SECONDS,
+        )
 
         if success:
             self.user_info_manager.record_sent_time(session)
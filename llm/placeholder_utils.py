@@ -12,13 +12,19 @@
 """
 
 import datetime
+import functools
+import re
+from typing import Optional
 from astrbot.api import logger
 from ..core.runtime_data import runtime_data
 from ..core.calendar_store import calendar_store
-from ..utils.time_utils import get_now, get_tz
+from ..utils.time_utils import format_now, get_now, get_tz
 
 DEFAULT_TIME_FORMAT = "%Y-%m-%d %H:%M:%S"
 
+# 占位符语法：{token}，token 为标识符
+_PLACEHOLDER_RE = re.compile(r"\{([A-Za-z_][A-Za-z0-9_]*)\}")
+
 WEEKDAY_NAMES = [
     "星期一",
     "星期二",
@@ -131,9 +137,10 @@ def resolve_event_identity(event) -> dict:
     供 ``build_placeholder_map``（实时取值）与会话快照记录复用，避免重复实现。
     """
     message_obj = event.message_obj
-    if hasattr(message_obj, "sender") and message_obj.sender:
-        username = message_obj.sender.nickname or "未知用户"
-        user_id = message_obj.sender.user_id or event.get_sender_id() or "未知"
+    sender = getattr(message_obj, "sender", None)
+    if sender:
+        username = sender.nickname or "未知用户"
+        user_id = sender.user_id or event.get_sender_id() or "未知"
     else:
         username = event.get_sender_name() or "未知用户"
         user_id = event.get_sender_id() or "未知"
@@ -151,17 +158,17 @@ def _resolve_current_time(event, config, astrbot_config, tz, time_format) -> str
     有 event 时优先使用消息时间戳（按 time_format 格式化），否则使用当前时间。
     """
     if event is None:
-        return get_now(config, astrbot_config).strftime(DEFAULT_TIME_FORMAT)
+        return format_now(config, astrbot_config)
     try:
-        message_obj = event.message_obj
-        if hasattr(message_obj, "timestamp") and message_obj.timestamp:
-            return datetime.datetime.fromtimestamp(
-                message_obj.timestamp, tz=tz
-            ).strftime(time_format)
-        return get_now(config, astrbot_config).strftime(time_format)
+        timestamp = getattr(event.message_obj, "timestamp", None)
+        if timestamp:
+            return datetime.datetime.fromtimestamp(timestamp, tz=tz).strftime(
+                time_format
+            )
+        return format_now(config, astrbot_config, time_format)
     except Exception as e:
         logger.warning(f"心念 | ⚠️ 时间格式错误 '{time_format}': {e}，使用默认格式")
-        return get_now(config, astrbot_config).strftime(DEFAULT_TIME_FORMAT)
+        return format_now(config, astrbot_config)
 
 
 def _resolve_calendar_today(config, now) -> str:
@@ -195,6 +202,8 @@ def build_placeholder_map(
     event=None,
     time_format: str = DEFAULT_TIME_FORMAT,
     build_user_context_func=None,
+    tokens=None,
+    identity: Optional[dict] = None,
 ) -> dict:
     """构建统一的占位符取值映射（唯一真相源）
 
@@ -207,62 +216,112 @@ def build_placeholder_map(
         time_format: 消息时间格式（仅在提供 event 时生效）
         build_user_context_func: 构建 ``{user_context}`` 的回调（可选）。
             仅在提供时才会产出 ``user_context`` 键。
+        tokens: 模板实际使用的占位符集合（可选）。提供时只计算这些键，
+            未使用的占位符（如相对时间、时间表）不会被求值。
+        identity: 调用方已解析好的 ``resolve_event_identity(event)`` 结果（可选），
+            提供时不再重复解析事件。
 
     Returns:
         ``{token: value}`` 形式的映射（键不含花括号）。
     """
+    wanted = None if tokens is None else frozenset(tokens)
+
+    def need(token: str) -> bool:
+        return wanted is None or token in wanted
+
     user_info = runtime_data.session_user_info.get(session, {})
-    last_sent_time = runtime_data.ai_last_sent_times.get(session, "从未发送过")
     user_last_time = user_info.get("last_active_time", "未知")
 
     tz = get_tz(config, astrbot_config)
-    now = get_now(config, astrbot_config)
-    current_time = _resolve_current_time(event, config, astrbot_config, tz, time_format)
+    now = (
+        get_now(config, astrbot_config)
+        if need("weekday") or need("calendar_today")
+        else None
+    )
 
-    if event is not None:
+    if identity is None and event is not None:
         identity = resolve_event_identity(event)
-        username = identity["username"]
-        user_id = identity["user_id"]
-        platform = identity["platform"]
-        chat_type = identity["chat_type"]
-    else:
-        username = user_info.get("username", "未知用户")
-        user_id = user_info.get("user_id", "未知")
-        platform = user_info.get("platform", "未知平台")
-        chat_type = user_info.get("chat_type", "未知")
-
-    mapping = {
-        "username": username,
-        "user_id": user_id,
-        "time": current_time,
-        "current_time": current_time,
-        "weekday": WEEKDAY_NAMES[now.weekday()],
-        "platform": platform,
-        "chat_type": chat_type,
-        "user_last_message_time": user_last_time,
-        "user_last_message_time_ago": format_time_ago(user_last_time, tz=tz),
-        "ai_last_sent_time": str(last_sent_time),
-        "unreplied_count": str(runtime_data.session_unreplied_count.get(session, 0)),
-    }
+    elif identity is None:
+        identity = {
+            "username": user_info.get("username", "未知用户"),
+            "user_id": user_info.get("user_id", "未知"),
+            "platform": user_info.get("platform", "未知平台"),
+            "chat_type": user_info.get("chat_type", "未知"),
+        }
+
+    mapping = {}
+    if need("username"):
+        mapping["username"] = identity["username"]
+    if need("user_id"):
+        mapping["user_id"] = identity["user_id"]
+    if need("time") or need("current_time"):
+        current_time = _resolve_current_time(
+            event, config, astrbot_config, tz, time_format
+        )
+        mapping["time"] = current_time
+        mapping["current_time"] = current_time
+    if need("weekday"):
+        mapping["weekday"] = WEEKDAY_NAMES[now.weekday()]
+    if need("platform"):
+        mapping["platform"] = identity["platform"]
+    if need("chat_type"):
+        mapping["chat_type"] = identity["chat_type"]
+    if need("user_last_message_time"):
+        mapping["user_last_message_time"] = user_last_time
+    if need("user_last_message_time_ago"):
+        mapping["user_last_message_time_ago"] = format_time_ago(user_last_time, tz=tz)
+    if need("ai_last_sent_time"):
+        mapping["ai_last_sent_time"] = str(
+            runtime_data.ai_last_sent_times.get(session, "从未发送过")
+        )
+    if need("unreplied_count"):
+        mapping["unreplied_count"] = str(
+            runtime_data.session_unreplied_count.get(session, 0)
+        )
 
     # user_context 取值代价较高，仅在调用方需要时才计算
-    if build_user_context_func is not None:
+    if build_user_context_func is not None and need("user_context"):
         try:
             mapping["user_context"] = build_user_context_func(session)
         except Exception as e:
             logger.warning(f"心念 | ⚠️ 构建 user_context 失败: {e}")
 
-    # calendar_today 必须作为最后一个键加入：render_template 按插入顺序替换，
-    # 此时其余占位符已替换完毕，事项文本中若含 {username} 等不会被二次展开（安全要求）。
-    mapping["calendar_today"] = _resolve_calendar_today(config, now)
+    # calendar_today 保持为最后一个键：事项文本中若含 {username} 等不得被二次展开
+    # （安全要求，render_template 单次拼接保证取值不会被再次扫描）。
+    if need("calendar_today"):
+        mapping["calendar_today"] = _resolve_calendar_today(config, now)
 
     return mapping
 
 
+@functools.lru_cache(maxsize=64)
+def compile_template(template: str) -> tuple:
+    """将模板预拆分为字面量与占位符片段（按模板字符串缓存）
+
+    奇数下标为占位符名（不含花括号），偶数下标为字面量文本。
+
+    Args:
+        template: 模板字符串
+
+    Returns:
+        片段元组
+    """
+    return tuple(_PLACEHOLDER_RE.split(template))
+
+
+def template_tokens(template: str) -> frozenset:
+    """返回模板中实际出现的占位符名集合"""
+    if not template or "{" not in template:
+        return frozenset()
+    return frozenset(compile_template(template)[1::2])
+
+
 def render_template(template: str, mapping: dict) -> str:
     """使用映射替换模板中的占位符
 
-    使用字符串替换，避免 str.format() 和 re.sub 的特殊字符问题。
+    基于预编译片段单次拼接，避免 str.format() 和 re.sub 的特殊字符问题；
+    取值文本不会被再次扫描，因此其中的 ``{username}`` 等不会被二次展开。
+    映射中不存在的占位符保持原样。
 
     Args:
         template: 模板字符串
@@ -273,14 +332,21 @@ def render_template(template: str, mapping: dict) -> str:
     """
     if not template:
         return template or ""
-    result = template
-    for token, value in mapping.items():
+    # 快速路径：不含任何花括号的模板无需拆分与替换
+    if "{" not in template:
+        return template
+    parts = list(compile_template(template))
+    for i in range(1, len(parts), 2):
+        token = parts[i]
+        if token not in mapping:
+            parts[i] = "{" + token + "}"
+            continue
         try:
-            result = result.replace("{" + token + "}", str(value))
+            parts[i] = str(mapping[token])
         except Exception as replace_error:
             logger.warning(f"心念 | ⚠️ 替换占位符 {token} 失败: {replace_error}")
-            continue
-    return result
+            parts[i] = "{" + token + "}"
+    return "".join(parts)
 
 
 def replace_placeholders(
@@ -308,6 +374,7 @@ def replace_placeholders(
             config,
             astrbot_config,
             build_user_context_func=build_user_context_func,
+            tokens=template_tokens(prompt),
         )
         return render_template(prompt, mapping)
     except Exception as e:
@@ -24,6 +24,10 @@ class PromptBuilder:
         self.config = config
         self.context = context
         self._astrbot_persona_resolved = False
+        # 插件独立的随机数生成器，避免与其他模块共享全局 Random 状态
+        self._rng = random.Random()
+        # 主动对话提示词解析缓存：(原始配置副本, 解析后的提示词元组)
+        self._prompt_list_cache = None
 
     def replace_placeholders(
         self, prompt: str, session: str, config: dict, build_user_context_func
@@ -103,6 +107,30 @@ class PromptBuilder:
 
         return ""
 
+    def get_prompt_list(self, prompt_list_data) -> tuple:
+        """解析主动对话提示词列表并缓存，原始配置不变时直接复用
+
+        列表可能被原地修改，因此以原始值的副本做相等比较。
+
+        Args:
+            prompt_list_data: 配置中的 proactive_prompt_list 原始值
+
+        Returns:
+            解析后的提示词元组
+        """
+        cache = self._prompt_list_cache
+        if cache is not None and cache[0] == prompt_list_data:
+            return cache[1]
+
+        prompts = tuple(parse_prompt_list(prompt_list_data))
+        raw_copy = (
+            list(prompt_list_data)
+            if isinstance(prompt_list_data, list)
+            else prompt_list_data
+        )
+        self._prompt_list_cache = (raw_copy, prompts)
+        return prompts
+
     def get_proactive_prompt(self, session: str, build_user_context_func) -> str:
         """获取并处理主动对话提示词
 
@@ -123,14 +151,14 @@ class PromptBuilder:
             logger.warning(f"心念 | ⚠️ 会话 {session} 没有配置主动消息提示词列表")
             return ""
 
-        # 解析主动对话提示词列表
-        prompt_list = parse_prompt_list(prompt_list_data)
+        # 解析主动对话提示词列表（配置不变时复用缓存）
+        prompt_list = self.get_prompt_list(prompt_list_data)
         if not prompt_list:
             logger.warning("心念 | ⚠️ 主动对话提示词列表为空")
             return ""
 
         # 随机选择一个主动对话提示词
-        selected_prompt = random.choice(prompt_list)
+        selected_prompt = self._rng.choice(prompt_list)
 
         # 替换提示词中的占位符
         final_prompt = replace_placeholders(
@@ -39,9 +39,9 @@ class AIScheduleMixin:
             # 列表追加
             runtime_data.session_ai_scheduled[session].append(schedule_info)
 
-        # 触发持久化
+        # 触发持久化（合并写入）
         if self.persistence_manager:
-            self.persistence_manager.save_persistent_data()
+            self.persistence_manager.schedule_save()
 
         fire_time_str = schedule_info["fire_time"]
         delay_minutes = schedule_info["delay_minutes"]
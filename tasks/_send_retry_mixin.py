@@ -11,13 +11,16 @@ class SendRetryMixin:
 
     _MAX_RETRIES = 3
     _RETRY_INTERVAL_SECONDS = 60
+    # 提取根因时最多追溯的异常链层数
+    _MAX_CAUSE_DEPTH = 8
 
     async def _send_with_retry(
         self, session: str, override_prompt: str = None
     ) -> tuple[bool, dict | None]:
         """带重试的消息发送
 
-        最多尝试 _MAX_RETRIES 次，每次间隔 _RETRY_INTERVAL_SECONDS 秒。
+        最多尝试 _MAX_RETRIES 次，每次间隔 _RETRY_INTERVAL_SECONDS 秒；
+        超时由消息生成器分别约束 LLM 调用与平台发送，内容送达后不会再触发重试。
         全部失败后发送错误通知给用户（不保存到历史记录）。
 
         Args:
@@ -40,17 +43,22 @@ class SendRetryMixin:
                 # 发送成功，清除连续失败计数
                 runtime_data.session_consecutive_failures.pop(session, None)
                 return True, schedule_info
+            except asyncio.TimeoutError as e:
+                last_error = e
+                logger.error(
+                    f"心念 | ❌ 向会话 {session} 生成主动消息超时"
+                    f"（第 {attempt}/{self._MAX_RETRIES} 次）"
+                )
             except Exception as e:
                 last_error = e
                 logger.error(
                     f"心念 | ❌ 向会话 {session} 发送主动消息失败"
                     f"（第 {attempt}/{self._MAX_RETRIES} 次）: {e}"
                 )
-                if attempt < self._MAX_RETRIES:
-                    logger.info(
-                        f"心念 | 等待 {self._RETRY_INTERVAL_SECONDS} 秒后重试..."
-                    )
-                    await asyncio.sleep(self._RETRY_INTERVAL_SECONDS)
+
+            if attempt < self._MAX_RETRIES:
+                logger.info(f"心念 | 等待 {self._RETRY_INTERVAL_SECONDS} 秒后重试...")
+                await asyncio.sleep(self._RETRY_INTERVAL_SECONDS)
 
         # 全部重试失败，发送错误通知给用户（不保存到历史记录）
         failures = runtime_data.session_consecutive_failures.get(session, 0) + 1
@@ -73,9 +81,13 @@ class SendRetryMixin:
         """
         try:
             # 提取原始异常链中的根因
+            # 限制追溯深度并防止异常链成环
             root_cause = error
-            while root_cause.__cause__:
-                root_cause = root_cause.__cause__
+            for _ in range(self._MAX_CAUSE_DEPTH):
+                cause = root_cause.__cause__
+                if cause is None or cause is error:
+                    break
+                root_cause = cause
             error_type = type(root_cause).__name__
             error_detail = str(root_cause)
 
@@ -1,8 +1,10 @@
 """智能睡眠计算与睡眠状态处理"""
 
+import logging
 from datetime import timedelta
 from astrbot.api import logger
 from ..core.runtime_data import runtime_data
+from ..utils.time_utils import get_seconds_until_sleep_end
 
 
 class SleepMixin:
@@ -46,8 +48,6 @@ class SleepMixin:
         Returns:
             睡眠秒数，范围 [1, 300]
         """
-        from ..utils.time_utils import get_seconds_until_sleep_end
-
         sessions = self.get_target_sessions()
         if not sessions:
             return 300  # 无会话时默认 5 分钟
@@ -89,6 +89,7 @@ class SleepMixin:
         已过期的计时器不保存，退出睡眠时保持过期状态。
         """
         now = self._get_now()
+        debug = logger.isEnabledFor(logging.DEBUG)
         for session in self.get_target_sessions():
             fire_time = self.get_session_next_fire_time(session)
             if fire_time:
@@ -96,16 +97,17 @@ class SleepMixin:
                 if remaining_seconds > 0:
                     # 只保存未过期的剩余时间
                     runtime_data.session_sleep_remaining[session] = remaining_seconds
-                    logger.debug(
-                        f"心念 | 会话 {session} 进入睡眠，剩余 {remaining_seconds:.0f} 秒"
-                    )
-                else:
+                    if debug:
+                        logger.debug(
+                            f"心念 | 会话 {session} 进入睡眠，剩余 {remaining_seconds:.0f} 秒"
+                        )
+                elif debug:
                     # 已过期的不保存，退出睡眠时保持过期状态
                     logger.debug(f"心念 | 会话 {session} 进入睡眠，计时器已过期")
 
         # 持久化保存
         if self.persistence_manager:
-            self.persistence_manager.save_persistent_data()
+            self.persistence_manager.schedule_save()
         self.notify_wakeup()
 
     def handle_exit_sleep(self):
@@ -119,38 +121,39 @@ class SleepMixin:
         time_awareness = self.config.get("time_awareness", {})
         send_on_wake = time_awareness.get("send_on_wake_enabled", False)
         wake_mode = time_awareness.get("wake_send_mode", "immediate")
-        now = self._get_now()
+        sessions = self.get_target_sessions()
 
-        for session in self.get_target_sessions():
-            if not send_on_wake:
-                # 模式1：跳过睡眠期间的主动消息
-                # 用 refresh_session_timer 而非 set_session_next_fire_time，
-                # 确保 AI 调度任务的 fire_time 不被常规间隔覆盖
+        # 模式在循环外确定一次，各模式只执行自己需要的逐会话处理
+        if not send_on_wake:
+            # 模式1：跳过睡眠期间的主动消息
+            # 用 refresh_session_timer 而非 set_session_next_fire_time，
+            # 确保 AI 调度任务的 fire_time 不被常规间隔覆盖
+            for session in sessions:
                 self.refresh_session_timer(session)
-                logger.debug(f"心念 | 会话 {session} 睡眠结束，跳过模式，刷新计时器")
-            elif wake_mode == "immediate":
-                # 模式2：保持原计时器，让主循环检测到过期后立即发送
-                logger.debug(
-                    f"心念 | 会话 {session} 睡眠结束，立即发送模式，保持原计时器"
-                )
-            else:
-                # 模式3：恢复剩余计时，延后发送
-                remaining = runtime_data.session_sleep_remaining.get(session)
+            logger.debug(
+                f"心念 | 睡眠结束，跳过模式，已刷新 {len(sessions)} 个会话的计时器"
+            )
+        elif wake_mode == "immediate":
+            # 模式2：保持原计时器，让主循环检测到过期后立即发送
+            logger.debug("心念 | 睡眠结束，立即发送模式，保持原计时器")
+        else:
+            # 模式3：恢复剩余计时，延后发送；无剩余时间记录（进入睡眠前已过期）的
+            # 会话保持过期状态，立即发送
+            now = self._get_now()
+            sleep_remaining = runtime_data.session_sleep_remaining
+            debug = logger.isEnabledFor(logging.DEBUG)
+            for session in sessions:
+                remaining = sleep_remaining.get(session)
                 if remaining is not None and remaining > 0:
-                    # 有剩余时间：延后发送
                     new_fire = now + timedelta(seconds=remaining)
                     self.set_session_next_fire_time(session, new_fire)
-                    logger.debug(
-                        f"心念 | 会话 {session} 睡眠结束，延后模式，恢复计时：{new_fire.strftime('%H:%M:%S')}"
-                    )
-                else:
-                    # 无剩余时间记录（进入睡眠前已过期）：保持过期状态，立即发送
-                    logger.debug(
-                        f"心念 | 会话 {session} 睡眠结束，延后模式，计时器已过期，保持过期状态"
-                    )
+                    if debug:
+                        logger.debug(
+                            f"心念 | 会话 {session} 睡眠结束，延后模式，恢复计时：{new_fire.strftime('%H:%M:%S')}"
+                        )
 
         # 清理 sleep_remaining
         runtime_data.session_sleep_remaining.clear()
         if self.persistence_manager:
-            self.persistence_manager.save_persistent_data()
+            self.persistence_manager.schedule_save()
         self.notify_wakeup()
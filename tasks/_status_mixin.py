@@ -1,9 +1,11 @@
 """状态检查、间隔计算与状态信息展示"""
 
-import random
+from datetime import datetime
+from typing import Optional
 from astrbot.api import logger
 from ..utils.parsers import parse_sessions_list
 from ..core.runtime_data import runtime_data
+from ..utils.time_utils import is_sleep_time as check_sleep_time
 
 
 class StatusMixin:
@@ -27,13 +29,40 @@ class StatusMixin:
 
     def get_target_sessions(self) -> list:
         """获取目标会话列表"""
+        return list(self._get_target_sessions_cached()[0])
+
+    def is_target_session(self, session: str) -> bool:
+        """检查会话是否在目标会话列表中（集合查找）"""
+        return session in self._get_target_sessions_cached()[1]
+
+    def _get_target_sessions_cached(self) -> tuple:
+        """解析并缓存目标会话列表，配置内容不变时直接复用
+
+        会话列表可能被原地修改（如 add_session），因此以原始值的副本做相等比较。
+
+        Returns:
+            (会话元组, 会话集合)
+        """
         sessions_data = self.config.get("proactive_reply", {}).get("sessions", [])
-        return parse_sessions_list(sessions_data)
+        cache = self._sessions_cache
+        if cache is not None and cache[0] == sessions_data:
+            return cache[1], cache[2]
+
+        parsed = parse_sessions_list(sessions_data)
+        # 去重并保持顺序，避免配置中的重复会话被重复发送
+        sessions = tuple(dict.fromkeys(parsed))
+        if len(sessions) != len(parsed):
+            logger.warning(
+                f"心念 | ⚠️ 目标会话列表中有 {len(parsed) - len(sessions)} 个重复会话，已忽略"
+            )
+        raw_copy = (
+            list(sessions_data) if isinstance(sessions_data, list) else sessions_data
+        )
+        self._sessions_cache = (raw_copy, sessions, frozenset(sessions))
+        return sessions, self._sessions_cache[2]
 
     def is_sleep_time(self) -> bool:
         """检查当前是否在睡眠时间段内"""
-        from ..utils.time_utils import is_sleep_time as check_sleep_time
-
         astrbot_config = self._get_astrbot_config()
         return check_sleep_time(self.config, astrbot_config)
 
@@ -72,21 +101,22 @@ class StatusMixin:
             if proactive_config.get("random_delay_enabled", False):
                 min_delay = proactive_config.get("min_random_minutes", 0)
                 max_delay = proactive_config.get("max_random_minutes", 30)
-                interval += random.randint(min_delay, max_delay)
+                interval += self._rng.randint(min_delay, max_delay)
             return interval
 
         # 随机间隔模式
         random_min = proactive_config.get("random_min_minutes", 600)
         random_max = proactive_config.get("random_max_minutes", 1200)
-        return random.randint(random_min, random_max)
+        return self._rng.randint(random_min, random_max)
 
     # ==================== 状态信息方法 ====================
 
-    def get_next_fire_info(self, session: str) -> str:
+    def get_next_fire_info(self, session: str, now: Optional[datetime] = None) -> str:
         """获取会话下次发送时间的展示信息
 
         Args:
             session: 会话ID
+            now: 当前时间，批量展示时由调用方统一传入，缺省时自动获取
 
         Returns:
             展示信息字符串
@@ -109,12 +139,11 @@ class StatusMixin:
 
             if remaining_minutes < 60:
                 return f"约{remaining_minutes}分钟后"
-            else:
-                hours = remaining_minutes // 60
-                minutes = remaining_minutes % 60
-                return f"约{hours}小时{minutes}分钟后"
+            hours, minutes = divmod(remaining_minutes, 60)
+            return f"约{hours}小时{minutes}分钟后"
 
-        now = self._get_now()
+        if now is None:
+            now = self._get_now()
 
         # 检查是否是 AI 调度任务
         is_ai_task = False
@@ -131,15 +160,13 @@ class StatusMixin:
         if fire_time <= now:
             return f"即将发送{suffix}"
 
-        delta = fire_time - now
-        total_minutes = int(delta.total_seconds() / 60)
+        total_minutes = int((fire_time - now).total_seconds() // 60)
+        clock = f"{fire_time.hour:02d}:{fire_time.minute:02d}"
 
         if total_minutes < 60:
-            return f"{total_minutes}分钟后 ({fire_time.strftime('%H:%M')}){suffix}"
-        else:
-            hours = total_minutes // 60
-            minutes = total_minutes % 60
-            return f"{hours}小时{minutes}分钟后 ({fire_time.strftime('%H:%M')}){suffix}"
+            return f"{total_minutes}分钟后 ({clock}){suffix}"
+        hours, minutes = divmod(total_minutes, 60)
+        return f"{hours}小时{minutes}分钟后 ({clock}){suffix}"
 
     def get_all_sessions_status(self) -> list:
         """获取所有会话的状态信息
@@ -148,7 +175,9 @@ class StatusMixin:
             [(session, next_fire_info), ...]
         """
         result = []
+        # 所有会话按同一时刻计算剩余时间，展示结果彼此一致
+        now = self._get_now()
         for session in self.get_target_sessions():
-            info = self.get_next_fire_info(session)
+            info = self.get_next_fire_info(session, now)
             result.append((session, info))
         return result
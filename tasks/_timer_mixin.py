@@ -1,10 +1,24 @@
 """会话计时器管理与配置变化检测"""
 
+import functools
+import logging
 from datetime import datetime, timedelta
 from typing import Optional
 from astrbot.api import logger
 from ..core.runtime_data import runtime_data
 
+# 持久化的下次发送时间格式
+FIRE_TIME_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+
+@functools.lru_cache(maxsize=256)
+def _parse_fire_time(time_str: str) -> datetime:
+    """解析下次发送时间字符串（按字符串缓存）
+
+    datetime 不可变，可安全复用；每轮主循环对各会话的重复读取只需一次字典查找。
+    """
+    return datetime.strptime(time_str, FIRE_TIME_FORMAT)
+
 
 class TimerMixin:
     """会话计时器管理与配置变化检测"""
@@ -22,8 +36,8 @@ class TimerMixin:
         if not time_str:
             return None
         try:
-            return datetime.strptime(time_str, "%Y-%m-%d %H:%M:%S")
-        except ValueError:
+            return _parse_fire_time(time_str)
+        except (TypeError, ValueError):
             logger.warning(
                 f"心念 | ⚠️ 会话 {session} 的下次发送时间格式错误: {time_str}"
             )
@@ -37,23 +51,28 @@ class TimerMixin:
             fire_time: 下次发送时间
         """
         runtime_data.session_next_fire_times[session] = fire_time.strftime(
-            "%Y-%m-%d %H:%M:%S"
+            FIRE_TIME_FORMAT
         )
-        # 触发持久化
+        # 触发持久化（合并写入：一轮发送/初始化中多个会话的更新只落盘一次）
         if self.persistence_manager:
-            self.persistence_manager.save_persistent_data()
+            self.persistence_manager.schedule_save()
 
-    def calculate_next_fire_time(self, session: str) -> datetime:
+    def calculate_next_fire_time(
+        self, session: str, now: Optional[datetime] = None
+    ) -> datetime:
         """计算会话的下次发送时间
 
         Args:
             session: 会话ID
+            now: 当前时间，批量计算时由调用方统一传入，缺省时自动获取
 
         Returns:
             下次发送时间
         """
         interval_minutes = self.get_session_target_interval(session)
-        return self._get_now() + timedelta(minutes=interval_minutes)
+        if now is None:
+            now = self._get_now()
+        return now + timedelta(minutes=interval_minutes)
 
     def refresh_session_timer(self, session: str):
         """刷新会话计时器（AI 发消息后调用）
@@ -65,7 +84,7 @@ class TimerMixin:
             session: 会话ID
         """
         # 只刷新在目标列表中的会话
-        if session not in self.get_target_sessions():
+        if not self.is_target_session(session):
             return
 
         # 1. 计算常规周期的下次触发时间
@@ -87,21 +106,28 @@ class TimerMixin:
                 # 如果 AI 任务时间更早，则优先触发
                 if min_ai_time < next_fire:
                     next_fire = min_ai_time
-                    logger.debug(
-                        f"心念 | 会话 {session} 存在更早的 AI 调度任务 ({min_ai_time})，优先执行"
-                    )
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug(
+                            f"心念 | 会话 {session} 存在更早的 AI 调度任务 ({min_ai_time})，优先执行"
+                        )
 
         self.set_session_next_fire_time(session, next_fire)
-        logger.debug(
-            f"心念 | 会话 {session} 计时器已刷新，下次发送：{next_fire.strftime('%H:%M:%S')}"
-        )
+        # 逐会话调用的热路径，仅在 DEBUG 启用时格式化日志
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                f"心念 | 会话 {session} 计时器已刷新，下次发送：{next_fire.strftime('%H:%M:%S')}"
+            )
         self.notify_wakeup()
 
     def ensure_all_sessions_scheduled(self):
         """确保所有目标会话都有下次发送时间"""
+        now = None
         for session in self.get_target_sessions():
             if not self.get_session_next_fire_time(session):
-                next_fire = self.calculate_next_fire_time(session)
+                # 同一轮初始化的会话共用一个当前时间，仅在确有会话需要初始化时获取
+                if now is None:
+                    now = self._get_now()
+                next_fire = self.calculate_next_fire_time(session, now)
                 self.set_session_next_fire_time(session, next_fire)
                 logger.info(
                     f"心念 | 会话 {session} 初始化计时器，下次发送：{next_fire.strftime('%Y-%m-%d %H:%M:%S')}"
@@ -146,7 +172,7 @@ class TimerMixin:
             logger.info(f"心念 | 已清除会话 {session} 的所有运行时数据")
             # 触发持久化
             if self.persistence_manager:
-                self.persistence_manager.save_persistent_data()
+                self.persistence_manager.schedule_save()
             self.notify_wakeup()
 
     def clear_all_session_timers(self):
@@ -159,7 +185,7 @@ class TimerMixin:
         logger.info("心念 | 已清除所有会话的计时器")
         # 触发持久化
         if self.persistence_manager:
-            self.persistence_manager.save_persistent_data()
+            self.persistence_manager.schedule_save()
         self.notify_wakeup()
 
     def _get_timing_config_signature(self) -> str:
@@ -201,7 +227,7 @@ class TimerMixin:
             runtime_data.timing_config_signature = current_signature
             self._last_timing_config_signature = current_signature
             if self.persistence_manager:
-                self.persistence_manager.save_persistent_data()
+                self.persistence_manager.schedule_save()
             return
 
         # 签名变化时清理计时器
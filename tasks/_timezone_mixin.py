@@ -2,8 +2,10 @@
 
 from datetime import datetime, timezone as _utc_tz
 from typing import Optional
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
 from astrbot.api import logger
 from ..core.runtime_data import runtime_data
+from ..utils.time_utils import get_now, get_tz
 
 
 class TimezoneMixin:
@@ -18,8 +20,6 @@ class TimezoneMixin:
 
     def _get_now(self) -> datetime:
         """获取当前时间（naive，已转换为配置时区的本地时间）"""
-        from ..utils.time_utils import get_now
-
         return get_now(self.config, self._get_astrbot_config()).replace(tzinfo=None)
 
     def _get_timezone_signature(self) -> str:
@@ -27,15 +27,11 @@ class TimezoneMixin:
 
         用于检测时区是否发生变化。
         """
-        from ..utils.time_utils import get_tz
-
         tz = get_tz(self.config, self._get_astrbot_config())
         return str(tz) if tz is not None else "system_local"
 
     def _utc_timestamp_to_local_naive(self, utc_ts: float) -> datetime:
         """将 UTC 时间戳转换为本地配置时区的 naive datetime（与 _get_now() 同源）"""
-        from ..utils.time_utils import get_tz
-
         utc_dt = datetime.fromtimestamp(utc_ts, tz=_utc_tz.utc)
         tz = get_tz(self.config, self._get_astrbot_config())
         if tz is not None:
@@ -64,8 +60,6 @@ class TimezoneMixin:
         将旧时区下的 wall-clock 时间转换为新时区下的 wall-clock 时间，
         保证任务在同一 UTC 绝对时刻触发。
         """
-        from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
-
         try:
             old_tz = ZoneInfo(old_tz_sig) if old_tz_sig != "system_local" else None
             new_tz = ZoneInfo(new_tz_sig) if new_tz_sig != "system_local" else None
@@ -128,7 +122,7 @@ class TimezoneMixin:
             runtime_data.timezone_signature = current_tz_sig
             logger.info(f"心念 | 🕐 当前有效时区: {current_tz_sig}")
             if self.persistence_manager:
-                self.persistence_manager.save_persistent_data()
+                self.persistence_manager.schedule_save()
             return
 
         if current_tz_sig != last_tz_sig:
@@ -140,5 +134,5 @@ class TimezoneMixin:
             self._recalculate_ai_schedule_fire_times(last_tz_sig, current_tz_sig)
             runtime_data.timezone_signature = current_tz_sig
             if self.persistence_manager:
-                self.persistence_manager.save_persistent_data()
+                self.persistence_manager.schedule_save()
             self.notify_wakeup()
@@ -6,9 +6,11 @@
 """
 
 import asyncio
+import random
 from typing import Optional
 from astrbot.api import logger
 from ..core.runtime_data import runtime_data
+from ..utils.time_utils import get_seconds_until_sleep_start
 from ._timezone_mixin import TimezoneMixin
 from ._timer_mixin import TimerMixin
 from ._sleep_mixin import SleepMixin
@@ -16,6 +18,13 @@ from ._ai_schedule_mixin import AIScheduleMixin
 from ._send_retry_mixin import SendRetryMixin
 from ._status_mixin import StatusMixin
 
+# 功能关闭时的兜底复查间隔（秒）。通过插件保存配置时会立即唤醒主循环。
+DISABLED_RECHECK_SECONDS = 300
+# 主循环出错后的退避等待秒数
+ERROR_BACKOFF_SECONDS = 60
+# 到期会话并发发送的上限，避免瞬间向平台发送过多请求
+MAX_CONCURRENT_SENDS = 16
+
 
 class ProactiveTaskManager(
     TimezoneMixin,
@@ -57,6 +66,41 @@ class ProactiveTaskManager(
         self._last_timing_config_signature: Optional[str] = None
         # 主循环可中断睡眠的唤醒事件（在 proactive_message_loop 启动时创建）
         self._wakeup_event: Optional[asyncio.Event] = None
+        # 任务管理器独立的随机数生成器（随机间隔计算使用）
+        self._rng = random.Random()
+        # 目标会话解析缓存：(原始配置副本, 会话元组, 会话集合)
+        self._sessions_cache: Optional[tuple] = None
+        # 由本管理器创建的主循环任务，完成后自动移除
+        self._owned_tasks: set[asyncio.Task] = set()
+        # 主循环启动信号（start_proactive_task 等待其就绪，替代固定延时探测）
+        self._loop_started: Optional[asyncio.Event] = None
+
+    def _spawn(self, coro) -> asyncio.Task:
+        """创建并登记一个由本管理器持有的任务"""
+        task = asyncio.create_task(coro)
+        self._owned_tasks.add(task)
+        task.add_done_callback(self._owned_tasks.discard)
+        return task
+
+    def spawn_proactive_loop(self) -> asyncio.Task:
+        """启动主循环任务并记录为当前定时任务"""
+        self._loop_started = asyncio.Event()
+        self.proactive_task = self._spawn(self.proactive_message_loop())
+        return self.proactive_task
+
+    async def _wait_loop_started(self, timeout: float = 2.0):
+        """等待主循环发出启动信号或提前结束，无需固定延时"""
+        task = self.proactive_task
+        started = self._loop_started
+        if task is None or started is None:
+            return
+        waiter = asyncio.ensure_future(started.wait())
+        try:
+            await asyncio.wait(
+                {waiter, task}, timeout=timeout, return_when=asyncio.FIRST_COMPLETED
+            )
+        finally:
+            waiter.cancel()
 
     def notify_wakeup(self):
         """有新任务或配置变化时唤醒主循环，使其立即重新调度"""
@@ -81,6 +125,8 @@ class ProactiveTaskManager(
         logger.info("心念 | 定时主动发送消息循环已启动（混合计时器模式）")
 
         self._wakeup_event = asyncio.Event()
+        if self._loop_started is not None:
+            self._loop_started.set()
 
         # 追踪睡眠状态
         was_sleeping = False
@@ -93,7 +139,8 @@ class ProactiveTaskManager(
 
                 # 检查功能是否启用
                 if not self.is_proactive_enabled():
-                    await asyncio.sleep(60)
+                    # 功能关闭时等待配置变更唤醒，超时兜底以便定期重新读取配置
+                    await self.wait_for_wakeup(DISABLED_RECHECK_SECONDS)
                     continue
 
                 # 睡眠状态检测与处理
@@ -153,14 +200,36 @@ class ProactiveTaskManager(
                 break
             except Exception as e:
                 logger.error(f"心念 | ❌ 定时主动发送消息循环发生错误: {e}")
-                await asyncio.sleep(60)
+                # 出错后退避等待，配置修正等唤醒可提前结束等待
+                await self.wait_for_wakeup(ERROR_BACKOFF_SECONDS)
+
+    async def wait_for_wakeup(self, timeout: float) -> bool:
+        """等待唤醒事件（不检查启用/睡眠状态），用于功能关闭等空闲场景
+
+        Args:
+            timeout: 最长等待秒数
+
+        Returns:
+            True 如果被唤醒，False 如果超时
+        """
+        if self._wakeup_event is None:
+            self._wakeup_event = asyncio.Event()
+
+        try:
+            await asyncio.wait_for(self._wakeup_event.wait(), timeout=timeout)
+        except asyncio.TimeoutError:
+            return False
+
+        self._wakeup_event.clear()
+        return True
 
     async def interruptible_sleep(
         self, total_seconds: int, *, check_sleep_time: bool = True
     ) -> bool:
         """可中断的睡眠
 
-        通过 Event 即时响应 AI 调度/配置变化；每段等待最长 10 秒以便检查终止等状态。
+        通过 Event 即时响应 AI 调度/配置变化/启停等状态变化，睡眠期间不再轮询；
+        需要检测睡眠时段时，等待时长会截断到睡眠开始的时刻。终止由任务取消直接打断。
 
         Args:
             total_seconds: 总睡眠秒数
@@ -179,131 +248,156 @@ class ProactiveTaskManager(
             self._wakeup_event.clear()
             return False
 
-        loop = asyncio.get_running_loop()
-        deadline = loop.time() + total_seconds
-
-        while True:
-            if self._wakeup_event.is_set():
-                self._wakeup_event.clear()
-                return False
-
-            if self._should_abort_sleep(check_sleep_time):
-                return False
+        if self._should_abort_sleep(check_sleep_time):
+            return False
 
-            remaining = deadline - loop.time()
-            if remaining <= 0:
-                return True
+        if check_sleep_time:
+            seconds_to_sleep = get_seconds_until_sleep_start(
+                self.config, self._get_astrbot_config()
+            )
+            if seconds_to_sleep is not None:
+                # 多等 1 秒，确保醒来时已跨入睡眠时段的起始分钟
+                total_seconds = min(total_seconds, seconds_to_sleep + 1)
 
-            chunk = min(10.0, remaining)
-            try:
-                await asyncio.wait_for(self._wakeup_event.wait(), timeout=chunk)
-            except asyncio.TimeoutError:
-                continue
+        try:
+            await asyncio.wait_for(self._wakeup_event.wait(), timeout=total_seconds)
+        except asyncio.TimeoutError:
+            return not self._should_abort_sleep(check_sleep_time)
 
-            self._wakeup_event.clear()
-            if self._should_abort_sleep(check_sleep_time):
-                return False
-            return False
+        self._wakeup_event.clear()
+        return False
 
     async def process_due_sessions(self, sleep_mode: bool = False):
         """处理所有到期的会话
 
+        到期会话并发发送（以信号量限制并发数），单个会话的重试等待不会阻塞其他会话。
+
         Args:
             sleep_mode: 睡眠模式。为 True 时跳过常规消息，只处理 AI 调度任务。
         """
         now = self._get_now()
-        sent_count = 0
         sessions = self.get_target_sessions()
 
+        due_sessions = []
         for session in sessions:
-            if self.should_terminate():
-                break
-
             fire_time = self.get_session_next_fire_time(session)
-            if fire_time and fire_time <= now:
-                # 检查是否是 AI 调度任务触发
-                ai_tasks = runtime_data.session_ai_scheduled.get(session, [])
-                due_ai_task = None
-
-                # 按时间排序找到最早的到期任务
-                sorted_tasks = []
-                for task in ai_tasks:
-                    t = self._get_task_fire_datetime(task)
-                    if t is not None:
-                        sorted_tasks.append((t, task))
-                sorted_tasks.sort(key=lambda x: x[0])
-
-                # 查找已到期的任务
-                for t, task in sorted_tasks:
-                    if t <= now:
-                        due_ai_task = task
-                        break
-
-                # 睡眠模式：跳过常规消息，只处理 AI 调度任务
-                if sleep_mode and not due_ai_task:
-                    continue
+            if not fire_time or fire_time > now:
+                continue
 
-                # 执行发送
-                override_prompt = None
-                if due_ai_task:
-                    override_prompt = due_ai_task.get("follow_up_prompt")
-                    if sleep_mode:
-                        # 睡眠时段内穿透发送，附加此背景让 LLM 知晓当前场景
-                        sleep_ctx = "[系统提示：当前处于夜间休眠时段, 但有预约的跟进任务需要执行, 请据此生成合适的消息]\n"
-                        override_prompt = sleep_ctx + (override_prompt or "")
-                    logger.info(
-                        f"心念 | 触发 AI 调度任务 [TaskID: {due_ai_task.get('task_id')}]"
-                        f"{'（睡眠时段穿透）' if sleep_mode else ''}"
-                    )
+            # 检查是否是 AI 调度任务触发
+            due_ai_task = self._find_due_ai_task(session, now)
+
+            # 睡眠模式：跳过常规消息，只处理 AI 调度任务
+            if sleep_mode and not due_ai_task:
+                continue
+            due_sessions.append((session, due_ai_task))
+
+        if not due_sessions:
+            return
 
-                success, schedule_info = await self._send_with_retry(
-                    session, override_prompt=override_prompt
-                )
-
-                if success:
-                    sent_count += 1
-                    # 如果是 AI 任务成功执行，从列表中移除
-                    if due_ai_task:
-                        try:
-                            # 重新获取引用以确保线程安全（虽然这里是单线程 async）
-                            current_tasks = runtime_data.session_ai_scheduled.get(
-                                session, []
-                            )
-                            # 使用 task_id 匹配删除，更稳健
-                            task_id_to_remove = due_ai_task.get("task_id")
-                            if task_id_to_remove:
-                                runtime_data.session_ai_scheduled[session] = [
-                                    t
-                                    for t in current_tasks
-                                    if t.get("task_id") != task_id_to_remove
-                                ]
-                            elif due_ai_task in current_tasks:
-                                # 兼容无 ID 的旧数据
-                                current_tasks.remove(due_ai_task)
-
-                            # 触发持久化
-                            if self.persistence_manager:
-                                self.persistence_manager.save_persistent_data()
-
-                        except Exception as e:
-                            logger.error(f"心念 | ❌ 移除 AI 调度任务失败: {e}")
-
-                    # 如果生成了新的 AI 调度（套娃），应用它
-                    if schedule_info:
-                        self.apply_ai_schedule(session, schedule_info)
-
-                    # 刷新计时器（取常规间隔和剩余 AI 任务中的最小值）
-                    self.refresh_session_timer(session)
-                else:
-                    # 失败逻辑：按理说应该重试或推迟？
-                    # 当前 _send_with_retry 已经重试过了。
-                    # 如果还是失败，暂时重置为默认间隔，避免死循环
-                    next_fire = self.calculate_next_fire_time(session)
-                    self.set_session_next_fire_time(session, next_fire)
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_SENDS)
+
+        async def _bounded_send(session, due_ai_task) -> bool:
+            async with semaphore:
+                if self.should_terminate():
+                    return False
+                return await self._process_due_session(session, due_ai_task, sleep_mode)
+
+        results = await asyncio.gather(
+            *(_bounded_send(s, t) for s, t in due_sessions),
+            return_exceptions=True,
+        )
+
+        sent_count = 0
+        for (session, _), result in zip(due_sessions, results):
+            if result is True:
+                sent_count += 1
+            elif isinstance(result, BaseException):
+                logger.error(f"心念 | ❌ 处理会话 {session} 时发生错误: {result}")
 
         if sent_count > 0:
             logger.info(f"心念 | 本轮发送了 {sent_count}/{len(sessions)} 条主动消息")
 
+    def _find_due_ai_task(self, session: str, now) -> Optional[dict]:
+        """查找会话中最早的已到期 AI 调度任务，没有则返回 None"""
+        ai_tasks = runtime_data.session_ai_scheduled.get(session, [])
+
+        # 单次遍历取最早的到期任务，无需整体排序；同一时间取列表中靠前者
+        earliest_time = None
+        earliest_task = None
+        for task in ai_tasks:
+            t = self._get_task_fire_datetime(task)
+            if t is None or t > now:
+                continue
+            if earliest_time is None or t < earliest_time:
+                earliest_time = t
+                earliest_task = task
+        return earliest_task
+
+    async def _process_due_session(
+        self, session: str, due_ai_task: Optional[dict], sleep_mode: bool
+    ) -> bool:
+        """执行单个到期会话的发送与计时器刷新
+
+        Returns:
+            是否发送成功
+        """
+        # 执行发送
+        override_prompt = None
+        if due_ai_task:
+            override_prompt = due_ai_task.get("follow_up_prompt")
+            if sleep_mode:
+                # 睡眠时段内穿透发送，附加此背景让 LLM 知晓当前场景
+                sleep_ctx = "[系统提示：当前处于夜间休眠时段, 但有预约的跟进任务需要执行, 请据此生成合适的消息]\n"
+                override_prompt = sleep_ctx + (override_prompt or "")
+            logger.info(
+                f"心念 | 触发 AI 调度任务 [TaskID: {due_ai_task.get('task_id')}]"
+                f"{'（睡眠时段穿透）' if sleep_mode else ''}"
+            )
+
+        success, schedule_info = await self._send_with_retry(
+            session, override_prompt=override_prompt
+        )
+
+        if not success:
+            # 失败逻辑：_send_with_retry 已经重试过了。
+            # 如果还是失败，暂时重置为默认间隔，避免死循环
+            next_fire = self.calculate_next_fire_time(session)
+            self.set_session_next_fire_time(session, next_fire)
+            return False
+
+        # 如果是 AI 任务成功执行，从列表中移除
+        if due_ai_task:
+            try:
+                # 重新获取引用：并发发送期间列表可能已被其他协程替换
+                current_tasks = runtime_data.session_ai_scheduled.get(session, [])
+                # 使用 task_id 匹配删除，更稳健
+                task_id_to_remove = due_ai_task.get("task_id")
+                if task_id_to_remove:
+                    runtime_data.session_ai_scheduled[session] = [
+                        t
+                        for t in current_tasks
+                        if t.get("task_id") != task_id_to_remove
+                    ]
+                elif due_ai_task in current_tasks:
+                    # 兼容无 ID 的旧数据
+                    current_tasks.remove(due_ai_task)
+
+                # 触发持久化（合并写入）
+                if self.persistence_manager:
+                    self.persistence_manager.schedule_save()
+
+            except Exception as e:
+                logger.error(f"心念 | ❌ 移除 AI 调度任务失败: {e}")
+
+        # 如果生成了新的 AI 调度（套娃），应用它
+        if schedule_info:
+            self.apply_ai_schedule(session, schedule_info)
+
+        # 刷新计时器（取常规间隔和剩余 AI 任务中的最小值）
+        self.refresh_session_timer(session)
+        return True
+
     # ==================== 任务控制方法 ====================
 
     async def stop_proactive_task(self):
@@ -313,16 +407,18 @@ class ProactiveTaskManager(
             return
 
         logger.info("心念 | 正在停止定时主动发送任务...")
-        self.proactive_task.cancel()
+        task = self.proactive_task
+        task.cancel()
 
         try:
-            await asyncio.wait_for(self.proactive_task, timeout=5.0)
-        except asyncio.CancelledError:
-            logger.info("心念 | ✅ 定时主动发送任务已停止")
-        except asyncio.TimeoutError:
-            logger.warning("心念 | ⚠️ 停止定时任务超时，任务可能仍在运行")
-        except RuntimeError as e:
-            logger.error(f"心念 | ❌ 任务运行时错误: {e}")
+            # 任务由本管理器持有，直接等待其结束即可，无需 wait_for 包装
+            done, _ = await asyncio.wait({task}, timeout=5.0)
+            if not done:
+                logger.warning("心念 | ⚠️ 停止定时任务超时，任务可能仍在运行")
+            elif not task.cancelled() and task.exception() is not None:
+                logger.error(f"心念 | ❌ 任务运行时错误: {task.exception()}")
+            else:
+                logger.info("心念 | ✅ 定时主动发送任务已停止")
         finally:
             self.proactive_task = None
             if self._wakeup_event is not None:
@@ -341,10 +437,10 @@ class ProactiveTaskManager(
             # 恢复 AI 调度任务
             self._restore_ai_schedules()
 
-            self.proactive_task = asyncio.create_task(self.proactive_message_loop())
+            self.spawn_proactive_loop()
             logger.info("心念 | ✅ 定时主动发送任务已启动")
 
-            await asyncio.sleep(0.1)
+            await self._wait_loop_started()
 
             if self.proactive_task.done():
                 logger.error("心念 | ❌ 定时任务启动后立即结束，可能有错误")
@@ -374,21 +470,23 @@ class ProactiveTaskManager(
 
         await self.stop_proactive_task()
 
-        # 查找并停止所有可能的相关任务
+        # 只需检查本管理器创建过的任务，无需扫描事件循环中的全部任务
         current_task = asyncio.current_task()
-        all_tasks = asyncio.all_tasks()
-
-        for task in all_tasks:
-            if task != current_task and not task.done():
-                if hasattr(task, "_coro") and task._coro:
-                    coro_name = getattr(task._coro, "__name__", "")
-                    if "proactive_message_loop" in coro_name:
-                        task.cancel()
-                        try:
-                            await task
-                        except (
-                            asyncio.CancelledError,
-                            asyncio.TimeoutError,
-                            RuntimeError,
-                        ):
-                            pass
+        pending = [
+            task
+            for task in self._owned_tasks
+            if task is not current_task and not task.done()
+        ]
+        if not pending:
+            return
+
+        # 先统一取消，再一次性等待全部结束，总耗时受同一超时约束
+        for task in pending:
+            task.cancel()
+        done, not_done = await asyncio.wait(pending, timeout=5.0)
+        for task in done:
+            # 取走异常，避免事件循环报告 "exception was never retrieved"
+            if not task.cancelled():
+                task.exception()
+        if not_done:
+            logger.warning(f"心念 | ⚠️ {len(not_done)} 个任务在超时内未能停止")
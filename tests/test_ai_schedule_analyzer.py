@@ -3,8 +3,11 @@ import unittest
 import importlib.util
 import asyncio
 from datetime import datetime, timedelta, timezone
+from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock
 
+ROOT = Path(__file__).resolve().parent.parent
+
 # Mock astrbot module before anything else
 sys.modules["astrbot"] = MagicMock()
 sys.modules["astrbot.api"] = MagicMock()
@@ -13,7 +16,7 @@ sys.modules["astrbot.api.star"] = MagicMock()
 
 # Load the module by file path to avoid triggering package initialization which imports other deps
 spec = importlib.util.spec_from_file_location(
-    "ai_schedule_analyzer", "llm/ai_schedule_analyzer.py"
+    "ai_schedule_analyzer", ROOT / "llm" / "ai_schedule_analyzer.py"
 )
 module = importlib.util.module_from_spec(spec)
 sys.modules["ai_schedule_analyzer"] = module
@@ -85,6 +88,19 @@ class TestAIScheduleAnalyzer(unittest.TestCase):
         result = parse_schedule_response(api_response)
         self.assertIsNone(result)
 
+    def test_parse_schedule_response_with_brace_in_prompt(self):
+        api_response = (
+            '好的：\n```json\n{"delay_minutes": 30, '
+            '"follow_up_prompt": "问问 {昵称} 的进展"}\n```\n以上'
+        )
+        result = parse_schedule_response(api_response)
+        self.assertIsNotNone(result)
+        self.assertEqual(result["delay_minutes"], 30)
+        self.assertEqual(result["follow_up_prompt"], "问问 {昵称} 的进展")
+
+    def test_parse_schedule_response_rejects_broken_json(self):
+        self.assertIsNone(parse_schedule_response('{"delay_minutes": 30,'))
+
 
 class TestFireTimeUtc(unittest.TestCase):
     """验证 fire_time_utc 与 fire_time 的一致性"""
@@ -0,0 +1,165 @@
+import asyncio
+import importlib.util
+import sys
+import types
+import unittest
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock, patch
+
+ROOT = Path(__file__).resolve().parent.parent
+PKG = "proactive_reply_message_generator_test"
+
+
+def _ensure_package(name: str, path: Path | None = None) -> types.ModuleType:
+    if name in sys.modules:
+        return sys.modules[name]
+    module = types.ModuleType(name)
+    if path is not None:
+        module.__path__ = [str(path)]
+    sys.modules[name] = module
+    return module
+
+
+def _load_from_package(module_name: str, rel_path: str) -> types.ModuleType:
+    _ensure_package(PKG, ROOT)
+    parts = module_name.split(".")
+    for idx in range(1, len(parts)):
+        parent = ".".join([PKG, *parts[:idx]])
+        sub = "/".join(parts[:idx])
+        _ensure_package(parent, ROOT / sub if sub else ROOT)
+    spec = importlib.util.spec_from_file_location(
+        f"{PKG}.{module_name}", ROOT / rel_path
+    )
+    module = importlib.util.module_from_spec(spec)
+    module.__package__ = f"{PKG}.{module_name.rsplit('.', 1)[0]}"
+    sys.modules[f"{PKG}.{module_name}"] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+sys.modules["astrbot"] = MagicMock()
+sys.modules["astrbot.api"] = MagicMock()
+sys.modules["astrbot.api.event"] = MagicMock()
+
+_load_from_package("constants", "constants.py")
+runtime_data = _load_from_package(
+    "core.runtime_data", "core/runtime_data.py"
+).runtime_data
+_load_from_package("utils.time_utils", "utils/time_utils.py")
+_load_from_package("llm.ai_schedule_analyzer", "llm/ai_schedule_analyzer.py")
+_load_from_package("llm.message_splitter", "llm/message_splitter.py")
+generator_module = _load_from_package(
+    "llm.message_generator", "llm/message_generator.py"
+)
+MessageGenerator = generator_module.MessageGenerator
+SendRetryMixin = _load_from_package(
+    "tasks._send_retry_mixin", "tasks/_send_retry_mixin.py"
+).SendRetryMixin
+
+
+def _make_generator(config: dict) -> MessageGenerator:
+    context = MagicMock()
+    context.get_current_chat_provider_id = AsyncMock(return_value="provider")
+    return MessageGenerator(config, context, MagicMock(), MagicMock(), MagicMock())
+
+
+class AnalyzeMessageForScheduleTest(unittest.TestCase):
+    def setUp(self):
+        runtime_data.session_ai_scheduled.clear()
+
+    def test_disabled_skips_analysis(self):
+        generator = _make_generator({"ai_schedule": {"enabled": False}})
+        analyze = AsyncMock()
+        with patch.object(generator_module, "analyze_for_schedule", analyze):
+            result = asyncio.run(generator.analyze_message_for_schedule("s", "hi"))
+        self.assertIsNone(result)
+        analyze.assert_not_awaited()
+
+    def test_enabled_runs_analysis_with_configured_timezone(self):
+        generator = _make_generator(
+            {
+                "ai_schedule": {"enabled": True},
+                "basic_settings": {"timezone": "Asia/Shanghai"},
+            }
+        )
+        schedule = {"delay_minutes": 30, "follow_up_prompt": "继续聊"}
+        analyze = AsyncMock(return_value=schedule)
+        with patch.object(generator_module, "analyze_for_schedule", analyze):
+            result = asyncio.run(
+                generator.analyze_message_for_schedule("s", "半小时后找你")
+            )
+
+        self.assertEqual(result, schedule)
+        kwargs = analyze.await_args.kwargs
+        self.assertEqual(kwargs["provider_id"], "provider")
+        self.assertEqual(kwargs["ai_message"], "半小时后找你")
+        self.assertEqual(str(kwargs["tz"]), "Asia/Shanghai")
+        self.assertTrue(kwargs["current_time_str"])
+
+
+class _Sender(SendRetryMixin):
+    def __init__(self, generator):
+        self.message_generator = generator
+        self.context = generator.context
+
+
+def _make_sending_generator(config: dict) -> MessageGenerator:
+    generator = _make_generator(config)
+    response = MagicMock(role="assistant", completion_text="在吗？")
+    generator.context.llm_generate = AsyncMock(return_value=response)
+    generator.context.send_message = AsyncMock(return_value=True)
+    generator.prompt_builder.get_persona_system_prompt = AsyncMock(return_value="")
+    generator.conversation_manager.add_message_to_conversation_history = AsyncMock()
+    return generator
+
+
+class SendWithRetryTimeoutTest(unittest.TestCase):
+    def setUp(self):
+        runtime_data.session_ai_scheduled.clear()
+        runtime_data.session_last_proactive_message.clear()
+        runtime_data.session_consecutive_failures.clear()
+
+    def test_schedule_analysis_timeout_after_delivery_does_not_resend(self):
+        generator = _make_sending_generator(
+            {"ai_schedule": {"enabled": True}, "message_split": {"enabled": False}}
+        )
+        analyze = AsyncMock(side_effect=asyncio.TimeoutError())
+        with patch.object(generator_module, "analyze_for_schedule", analyze):
+            success, schedule = asyncio.run(_Sender(generator)._send_with_retry("s"))
+
+        self.assertTrue(success)
+        self.assertIsNone(schedule)
+        generator.context.llm_generate.assert_awaited_once()
+        generator.context.send_message.assert_awaited_once()
+
+    def test_platform_send_timeout_does_not_resend(self):
+        generator = _make_sending_generator({"message_split": {"enabled": False}})
+
+        async def _hang(*args, **kwargs):
+            await asyncio.sleep(10)
+
+        generator.context.send_message = AsyncMock(side_effect=_hang)
+        with patch.object(generator_module, "PLATFORM_SEND_TIMEOUT_SECONDS", 0.01):
+            success, _ = asyncio.run(_Sender(generator)._send_with_retry("s"))
+
+        self.assertTrue(success)
+        generator.context.llm_generate.assert_awaited_once()
+        generator.context.send_message.assert_awaited_once()
+
+    def test_generation_timeout_is_retried(self):
+        generator = _make_sending_generator({"message_split": {"enabled": False}})
+        response = generator.context.llm_generate.return_value
+        generator.context.llm_generate = AsyncMock(
+            side_effect=[asyncio.TimeoutError(), response]
+        )
+        sender = _Sender(generator)
+        sender._RETRY_INTERVAL_SECONDS = 0
+        success, _ = asyncio.run(sender._send_with_retry("s"))
+
+        self.assertTrue(success)
+        self.assertEqual(generator.context.llm_generate.await_count, 2)
+        generator.context.send_message.assert_awaited_once()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,56 @@
+import importlib.util
+import sys
+import unittest
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+ROOT = Path(__file__).resolve().parent.parent
+
+sys.modules["astrbot"] = MagicMock()
+sys.modules["astrbot.api"] = MagicMock()
+
+spec = importlib.util.spec_from_file_location("parsers", ROOT / "utils" / "parsers.py")
+parsers = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(parsers)
+
+
+class ParseSessionsListTest(unittest.TestCase):
+    def test_list_is_stripped_and_filtered(self):
+        self.assertEqual(
+            parsers.parse_sessions_list([" a ", "", None, "  ", "b"]), ["a", "b"]
+        )
+
+    def test_json_string(self):
+        self.assertEqual(parsers.parse_sessions_list('["a", " b "]'), ["a", "b"])
+
+    def test_newline_string_handles_crlf(self):
+        self.assertEqual(
+            parsers.parse_sessions_list("a\r\n\r\n b \nc"), ["a", "b", "c"]
+        )
+
+    def test_unsupported_type_returns_empty(self):
+        self.assertEqual(parsers.parse_sessions_list(None), [])
+
+    def test_non_array_text_skips_json_parsing(self):
+        with patch.object(parsers.json, "loads") as loads:
+            self.assertEqual(parsers.parse_sessions_list("a\nb"), ["a", "b"])
+        loads.assert_not_called()
+
+    def test_invalid_or_non_list_json_falls_back_to_lines(self):
+        self.assertEqual(parsers.parse_sessions_list("[a\nb"), ["[a", "b"])
+        self.assertEqual(parsers.parse_sessions_list('"a"'), ['"a"'])
+
+
+class ParsePromptListTest(unittest.TestCase):
+    def test_list_items_are_stringified(self):
+        self.assertEqual(parsers.parse_prompt_list(["hi ", 1, ""]), ["hi", "1"])
+
+    def test_newline_string(self):
+        self.assertEqual(parsers.parse_prompt_list("p1\n\n p2 "), ["p1", "p2"])
+
+    def test_json_string_with_leading_whitespace(self):
+        self.assertEqual(parsers.parse_prompt_list('  ["p1", ""]'), ["p1"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -111,6 +111,19 @@ class TestRenderTemplate(unittest.TestCase):
         # template 为 None（如配置 template: null）应返回 ""，避免 None 流向下游
         self.assertEqual(ph.render_template(None, {"username": "x"}), "")
 
+    def test_values_are_not_expanded_again(self):
+        out = ph.render_template(
+            "{username}/{time}", {"username": "{time}", "time": "12:00"}
+        )
+        self.assertEqual(out, "{time}/12:00")
+
+    def test_template_tokens(self):
+        self.assertEqual(
+            ph.template_tokens("{username} {user_context} {a-b}"),
+            frozenset({"username", "user_context"}),
+        )
+        self.assertEqual(ph.template_tokens(""), frozenset())
+
 
 class TestBuildPlaceholderMap(unittest.TestCase):
     def setUp(self):
@@ -152,6 +165,17 @@ class TestBuildPlaceholderMap(unittest.TestCase):
         )
         self.assertEqual(mapping["user_context"], f"上下文::{SESSION}")
 
+    def test_tokens_limit_computed_keys(self):
+        calls = []
+        mapping = ph.build_placeholder_map(
+            SESSION,
+            {},
+            build_user_context_func=lambda s: calls.append(s) or "ctx",
+            tokens={"username", "unreplied_count"},
+        )
+        self.assertEqual(set(mapping), {"username", "unreplied_count"})
+        self.assertEqual(calls, [])
+
 
 class TestReplacePlaceholdersUnification(unittest.TestCase):
     def setUp(self):
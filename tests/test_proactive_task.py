@@ -0,0 +1,174 @@
+import asyncio
+import importlib.util
+import sys
+import types
+import unittest
+from datetime import datetime, timedelta
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+ROOT = Path(__file__).resolve().parent.parent
+PKG = "proactive_reply_task_test"
+
+
+def _ensure_package(name: str, path: Path | None = None) -> types.ModuleType:
+    if name in sys.modules:
+        return sys.modules[name]
+    module = types.ModuleType(name)
+    if path is not None:
+        module.__path__ = [str(path)]
+    sys.modules[name] = module
+    return module
+
+
+def _load_from_package(module_name: str, rel_path: str) -> types.ModuleType:
+    _ensure_package(PKG, ROOT)
+    parts = module_name.split(".")
+    for idx in range(1, len(parts)):
+        parent = ".".join([PKG, *parts[:idx]])
+        sub = "/".join(parts[:idx])
+        _ensure_package(parent, ROOT / sub if sub else ROOT)
+    spec = importlib.util.spec_from_file_location(
+        f"{PKG}.{module_name}", ROOT / rel_path
+    )
+    module = importlib.util.module_from_spec(spec)
+    module.__package__ = f"{PKG}.{module_name.rsplit('.', 1)[0]}"
+    sys.modules[f"{PKG}.{module_name}"] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+sys.modules["astrbot"] = MagicMock()
+sys.modules["astrbot.api"] = MagicMock()
+sys.modules["astrbot.api.event"] = MagicMock()
+
+runtime_data = _load_from_package(
+    "core.runtime_data", "core/runtime_data.py"
+).runtime_data
+_load_from_package("utils.time_utils", "utils/time_utils.py")
+_load_from_package("utils.parsers", "utils/parsers.py")
+for _mixin in (
+    "_timezone_mixin",
+    "_timer_mixin",
+    "_sleep_mixin",
+    "_ai_schedule_mixin",
+    "_send_retry_mixin",
+    "_status_mixin",
+):
+    _load_from_package(f"tasks.{_mixin}", f"tasks/{_mixin}.py")
+task_module = _load_from_package("tasks.proactive_task", "tasks/proactive_task.py")
+ProactiveTaskManager = task_module.ProactiveTaskManager
+
+NOW = datetime(2026, 1, 1, 12, 0)
+PAST = (NOW - timedelta(minutes=5)).strftime("%Y-%m-%d %H:%M:%S")
+
+
+def _make_manager(sessions: list) -> ProactiveTaskManager:
+    config = {"proactive_reply": {"sessions": sessions, "interval_minutes": 60}}
+    manager = ProactiveTaskManager(
+        config, MagicMock(), MagicMock(), MagicMock(), lambda: False
+    )
+    manager._get_now = lambda: NOW
+    return manager
+
+
+def _ai_task(task_id: str, fire_time: str = PAST) -> dict:
+    return {"task_id": task_id, "fire_time": fire_time, "follow_up_prompt": "跟进"}
+
+
+class ProcessDueSessionsTest(unittest.TestCase):
+    def setUp(self):
+        runtime_data.session_next_fire_times.clear()
+        runtime_data.session_ai_scheduled.clear()
+
+    def _mark_due(self, *sessions):
+        for session in sessions:
+            runtime_data.session_next_fire_times[session] = PAST
+
+    def test_concurrency_is_bounded_by_semaphore(self):
+        sessions = [f"s{i}" for i in range(5)]
+        manager = _make_manager(sessions)
+        self._mark_due(*sessions)
+        active = 0
+        peak = 0
+        sent = []
+
+        async def _send(session, override_prompt=None):
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+            sent.append(session)
+            return True, None
+
+        manager._send_with_retry = _send
+        with patch.object(task_module, "MAX_CONCURRENT_SENDS", 2):
+            asyncio.run(manager.process_due_sessions())
+
+        self.assertEqual(peak, 2)
+        self.assertCountEqual(sent, sessions)
+
+    def test_failing_session_does_not_stop_others(self):
+        manager = _make_manager(["a", "b", "c"])
+        self._mark_due("a", "b", "c")
+
+        async def _send(session, override_prompt=None):
+            if session == "b":
+                raise RuntimeError("boom")
+            return True, None
+
+        manager._send_with_retry = _send
+        asyncio.run(manager.process_due_sessions())
+
+        # 成功的会话已刷新到未来时间，失败会话保持原状
+        self.assertGreater(manager.get_session_next_fire_time("a"), NOW)
+        self.assertGreater(manager.get_session_next_fire_time("c"), NOW)
+        self.assertEqual(runtime_data.session_next_fire_times["b"], PAST)
+
+    def test_sleep_mode_skips_regular_sends(self):
+        manager = _make_manager(["regular", "scheduled"])
+        self._mark_due("regular", "scheduled")
+        runtime_data.session_ai_scheduled["scheduled"] = [_ai_task("t1")]
+        calls = []
+
+        async def _send(session, override_prompt=None):
+            calls.append((session, override_prompt))
+            return True, None
+
+        manager._send_with_retry = _send
+        asyncio.run(manager.process_due_sessions(sleep_mode=True))
+
+        self.assertEqual([session for session, _ in calls], ["scheduled"])
+        self.assertIn("夜间休眠", calls[0][1])
+        self.assertTrue(calls[0][1].endswith("跟进"))
+        self.assertEqual(runtime_data.session_next_fire_times["regular"], PAST)
+
+    def test_due_ai_task_is_removed_only_after_success(self):
+        manager = _make_manager(["ok", "fail"])
+        self._mark_due("ok", "fail")
+        future = (NOW + timedelta(hours=1)).strftime("%Y-%m-%d %H:%M:%S")
+        runtime_data.session_ai_scheduled["ok"] = [
+            _ai_task("done"),
+            _ai_task("later", future),
+        ]
+        runtime_data.session_ai_scheduled["fail"] = [_ai_task("kept")]
+
+        async def _send(session, override_prompt=None):
+            return session == "ok", None
+
+        manager._send_with_retry = _send
+        asyncio.run(manager.process_due_sessions())
+
+        remaining = [t["task_id"] for t in runtime_data.session_ai_scheduled["ok"]]
+        self.assertEqual(remaining, ["later"])
+        self.assertEqual(
+            [t["task_id"] for t in runtime_data.session_ai_scheduled["fail"]],
+            ["kept"],
+        )
+        # 剩余 AI 任务早于常规间隔，计时器对齐到该任务
+        self.assertEqual(runtime_data.session_next_fire_times["ok"], future)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,174 @@
+import datetime
+import importlib.util
+import sys
+import types
+import unittest
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+ROOT = Path(__file__).resolve().parent.parent
+PKG = "proactive_reply_time_utils_test"
+
+
+def _ensure_package(name: str, path: Path | None = None) -> types.ModuleType:
+    if name in sys.modules:
+        return sys.modules[name]
+    module = types.ModuleType(name)
+    if path is not None:
+        module.__path__ = [str(path)]
+    sys.modules[name] = module
+    return module
+
+
+def _load_from_package(module_name: str, rel_path: str) -> types.ModuleType:
+    _ensure_package(PKG, ROOT)
+    parts = module_name.split(".")
+    for idx in range(1, len(parts)):
+        parent = ".".join([PKG, *parts[:idx]])
+        sub = "/".join(parts[:idx])
+        _ensure_package(parent, ROOT / sub if sub else ROOT)
+    spec = importlib.util.spec_from_file_location(
+        f"{PKG}.{module_name}", ROOT / rel_path
+    )
+    module = importlib.util.module_from_spec(spec)
+    module.__package__ = f"{PKG}.{module_name.rsplit('.', 1)[0]}"
+    sys.modules[f"{PKG}.{module_name}"] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+sys.modules["astrbot"] = MagicMock()
+sys.modules["astrbot.api"] = MagicMock()
+
+time_utils = _load_from_package("utils.time_utils", "utils/time_utils.py")
+
+
+class _FixedDateTime(datetime.datetime):
+    fixed = datetime.datetime(2026, 1, 1, 12, 0)
+
+    @classmethod
+    def now(cls, tz=None):
+        return cls.fixed if tz is None else cls.fixed.replace(tzinfo=tz)
+
+
+def _at(hour: int, minute: int):
+    _FixedDateTime.fixed = datetime.datetime(2026, 1, 1, hour, minute)
+    return patch.object(time_utils.datetime, "datetime", _FixedDateTime)
+
+
+def _minute_of_day(hour: int, minute: int):
+    return patch.object(
+        time_utils, "_current_minute_of_day", return_value=hour * 60 + minute
+    )
+
+
+class ParseTimeRangeTest(unittest.TestCase):
+    def test_parses_to_minutes(self):
+        self.assertEqual(time_utils.parse_time_range("22:00-8:30"), (1320, 510))
+
+    def test_invalid_returns_none(self):
+        self.assertIsNone(time_utils.parse_time_range("abc"))
+        self.assertIsNone(time_utils.parse_time_range("25-8:00"))
+        self.assertIsNone(time_utils.parse_time_range("8:00-9:00-10:00"))
+
+    def test_tolerates_whitespace_and_single_digit_minutes(self):
+        self.assertEqual(time_utils.parse_time_range(" 8:5 - 09:30 "), (485, 570))
+
+
+class IsInTimeRangeTest(unittest.TestCase):
+    def test_same_day_range(self):
+        with _minute_of_day(12, 0):
+            self.assertTrue(time_utils.is_in_time_range("9:00-18:00"))
+        with _minute_of_day(18, 1):
+            self.assertFalse(time_utils.is_in_time_range("9:00-18:00"))
+
+    def test_cross_midnight_range(self):
+        with _minute_of_day(23, 30):
+            self.assertTrue(time_utils.is_in_time_range("22:00-8:00"))
+        with _minute_of_day(7, 59):
+            self.assertTrue(time_utils.is_in_time_range("22:00-8:00"))
+        with _minute_of_day(12, 0):
+            self.assertFalse(time_utils.is_in_time_range("22:00-8:00"))
+
+    def test_whole_day_range_skips_clock(self):
+        with patch.object(time_utils, "_current_minute_of_day") as minute:
+            self.assertTrue(time_utils.is_in_time_range("0:00-23:59"))
+            self.assertTrue(time_utils.is_in_time_range("8:00-7:59"))
+        minute.assert_not_called()
+
+    def test_invalid_range_is_false(self):
+        self.assertFalse(time_utils.is_in_time_range("not-a-range"))
+
+    def test_minute_of_day_without_tz_uses_localtime(self):
+        fake = time_utils.time.struct_time((2026, 1, 1, 13, 45, 0, 3, 1, 0))
+        with patch.object(time_utils.time, "localtime", return_value=fake):
+            self.assertEqual(time_utils._current_minute_of_day(), 13 * 60 + 45)
+
+
+class SecondsUntilSleepStartTest(unittest.TestCase):
+    def _config(self, enabled=True, hours="22:00-8:00"):
+        return {"time_awareness": {"sleep_mode_enabled": enabled, "sleep_hours": hours}}
+
+    def test_counts_down_to_sleep_start(self):
+        with _at(21, 30), _minute_of_day(21, 30):
+            self.assertEqual(
+                time_utils.get_seconds_until_sleep_start(self._config()), 30 * 60
+            )
+
+    def test_midnight_written_as_24_00(self):
+        with _at(21, 30), _minute_of_day(21, 30):
+            self.assertEqual(
+                time_utils.get_seconds_until_sleep_start(
+                    self._config(hours="24:00-6:00")
+                ),
+                150 * 60,
+            )
+
+    def test_out_of_range_start_does_not_raise(self):
+        with _at(21, 30), _minute_of_day(21, 30):
+            seconds = time_utils.get_seconds_until_sleep_start(
+                self._config(hours="99:99-6:00")
+            )
+        self.assertIsInstance(seconds, int)
+        self.assertGreater(seconds, 0)
+
+    def test_none_when_disabled_or_already_sleeping(self):
+        with _at(23, 0), _minute_of_day(23, 0):
+            self.assertIsNone(time_utils.get_seconds_until_sleep_start(self._config()))
+        self.assertIsNone(
+            time_utils.get_seconds_until_sleep_start(self._config(enabled=False))
+        )
+
+
+class FormatNowTest(unittest.TestCase):
+    def test_reuses_text_within_same_second(self):
+        config = {}
+        with patch.object(time_utils.time, "time", return_value=1000.2):
+            with _at(8, 0):
+                first = time_utils.format_now(config, time_format="%H:%M")
+            with _at(9, 0):
+                second = time_utils.format_now(config, time_format="%H:%M")
+        self.assertEqual(first, "08:00")
+        self.assertEqual(second, "08:00")
+
+    def test_refreshes_on_next_second_or_new_format(self):
+        fmt = time_utils.format_now
+        with patch.object(time_utils.time, "time", return_value=2000.0), _at(8, 0):
+            self.assertEqual(fmt({}, time_format="%H:%M"), "08:00")
+            self.assertEqual(fmt({}, time_format="%H"), "08")
+        with patch.object(time_utils.time, "time", return_value=2001.0), _at(9, 0):
+            self.assertEqual(fmt({}, time_format="%H:%M"), "09:00")
+
+    def test_alternating_formats_stay_cached(self):
+        fmt = time_utils.format_now
+        with patch.object(time_utils.time, "time", return_value=3000.0):
+            with _at(8, 0):
+                fmt({}, time_format="%H:%M")
+                fmt({}, time_format="%H")
+            with _at(9, 0):
+                self.assertEqual(fmt({}, time_format="%H:%M"), "08:00")
+                self.assertEqual(fmt({}, time_format="%H"), "08")
+
+
+if __name__ == "__main__":
+    unittest.main()
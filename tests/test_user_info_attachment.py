@@ -5,7 +5,7 @@ import types
 import unittest
 from dataclasses import dataclass, field
 from pathlib import Path
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 ROOT = Path(__file__).resolve().parent.parent
 PKG = "proactive_reply_test"
@@ -186,6 +186,51 @@ class TestUserInfoAttachment(unittest.TestCase):
         self.assertNotIn("固定时间规则", req.extra_user_content_parts[0].text)
         self.assertNotIn("固定时间规则", req.extra_user_content_parts[1].text)
 
+    def test_empty_template_injects_no_user_info_part(self):
+        self.manager.config = {
+            "user_info": {"enabled": True, "template": "   "},
+            "time_awareness": {"time_guidance_enabled": False},
+        }
+        self.manager._get_sleep_prompt_if_active = lambda: "睡眠时间提示"
+        req = MockReq(prompt="你好")
+
+        asyncio.run(self.manager.add_user_info_to_request(MockEvent(), req))
+
+        self.assertEqual(len(req.extra_user_content_parts), 1)
+        self.assertEqual(req.extra_user_content_parts[0].text, "睡眠时间提示")
+
+    def test_placeholder_free_template_is_used_verbatim(self):
+        self.manager.config = {
+            "user_info": {"enabled": True, "template": "请用口语回复"},
+            "time_awareness": {"time_guidance_enabled": False},
+        }
+        self.manager._get_sleep_prompt_if_active = lambda: ""
+        self.manager._render_user_info = MagicMock()
+        req = MockReq(prompt="你好")
+
+        asyncio.run(self.manager.add_user_info_to_request(MockEvent(), req))
+
+        self.manager._render_user_info.assert_not_called()
+        self.assertEqual(len(req.extra_user_content_parts), 1)
+        self.assertEqual(req.extra_user_content_parts[0].text, "请用口语回复")
+
+    def test_event_identity_is_resolved_once_per_request(self):
+        self.manager.config = {
+            "user_info": {"enabled": True, "template": "用户:{username}"},
+            "time_awareness": {"time_guidance_enabled": False},
+        }
+        self.manager._get_sleep_prompt_if_active = lambda: ""
+        real = user_info_module.resolve_event_identity
+        req = MockReq(prompt="你好")
+
+        with patch.object(
+            user_info_module, "resolve_event_identity", side_effect=real
+        ) as resolve:
+            asyncio.run(self.manager.add_user_info_to_request(MockEvent(), req))
+
+        resolve.assert_called_once()
+        self.assertEqual(req.extra_user_content_parts[0].text, "用户:小明")
+
     def test_user_info_wraps_existing_extra_parts_before_sleep_prompt(self):
         self.manager.config = {
             "user_info": {
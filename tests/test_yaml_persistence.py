@@ -1,3 +1,4 @@
+import asyncio
 import importlib.util
 import json
 import os
@@ -6,7 +7,7 @@ import tempfile
 import types
 import unittest
 from pathlib import Path
-from unittest.mock import MagicMock
+from unittest.mock import AsyncMock, MagicMock, patch
 
 ROOT = Path(__file__).resolve().parent.parent
 PKG = "proactive_reply_yaml_test"
@@ -278,6 +279,52 @@ class TestPersistentMigration(unittest.TestCase):
         self.assertEqual(runtime_data.timezone_signature, "Asia/Shanghai")
 
 
+class TestScheduledSave(unittest.TestCase):
+    def _make_pm(self):
+        pm = pm_mod.PersistenceManager(config={}, context=MagicMock())
+        pm.save_persistent_data = MagicMock(return_value=True)
+        pm.save_persistent_data_async = AsyncMock(return_value=True)
+        return pm
+
+    def test_burst_of_schedules_writes_once(self):
+        pm = self._make_pm()
+
+        async def run():
+            with patch.object(pm_mod, "SAVE_DEBOUNCE_SECONDS", 0.01):
+                for _ in range(5):
+                    self.assertTrue(pm.schedule_save())
+                await pm._save_task
+
+        asyncio.run(run())
+        pm.save_persistent_data_async.assert_awaited_once()
+        pm.save_persistent_data.assert_not_called()
+
+    def test_without_running_loop_saves_synchronously(self):
+        pm = self._make_pm()
+        self.assertTrue(pm.schedule_save())
+        pm.save_persistent_data.assert_called_once()
+
+    def test_flush_pending_save_writes_immediately(self):
+        pm = self._make_pm()
+
+        async def run():
+            pm.schedule_save()
+            await pm.flush_pending_save()
+
+        asyncio.run(run())
+        pm.save_persistent_data.assert_called_once()
+        self.assertIsNone(pm._save_task)
+
+    def test_stale_snapshot_does_not_overwrite_newer(self):
+        pm = pm_mod.PersistenceManager(config={}, context=MagicMock())
+        with tempfile.TemporaryDirectory() as d:
+            path = os.path.join(d, "data.yml")
+            self.assertTrue(pm._write_persistent_text(2, path, "new: 1\n"))
+            self.assertTrue(pm._write_persistent_text(1, path, "old: 1\n"))
+            with open(path, encoding="utf-8") as f:
+                self.assertEqual(f.read(), "new: 1\n")
+
+
 class TestCalendarMigration(unittest.TestCase):
     def test_legacy_calendar_json_migrates(self):
         with tempfile.TemporaryDirectory() as d:
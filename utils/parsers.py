@@ -8,6 +8,34 @@ import json
 from astrbot.api import logger
 
 
+def _strip_items(items) -> list:
+    """逐项去除首尾空白并过滤空项（每项只 strip 一次）"""
+    return [s for s in (str(item).strip() for item in items if item) if s]
+
+
+def _split_lines(text: str) -> list:
+    """按行拆分文本，去除首尾空白并过滤空行（兼容 \r\n 换行）"""
+    return [s for s in map(str.strip, text.splitlines()) if s]
+
+
+def _parse_text_list(text: str) -> list:
+    """解析字符串格式的列表：优先按 JSON 数组解析，否则按行拆分
+
+    不以 "[" 开头的文本不可能是 JSON 数组，直接按行拆分，
+    省去旧配置最常见的换行格式下 json.loads 失败抛异常的开销。
+    """
+    if text.lstrip().startswith("["):
+        try:
+            parsed = json.loads(text)
+        except json.JSONDecodeError:
+            parsed = None
+        if isinstance(parsed, list):
+            # 过滤空字符串
+            return _strip_items(parsed)
+    # 回退到传统换行格式
+    return _split_lines(text)
+
+
 def parse_sessions_list(sessions_data) -> list:
     """解析会话列表（支持列表格式、JSON格式和传统换行格式）
 
@@ -17,27 +45,15 @@ def parse_sessions_list(sessions_data) -> list:
     Returns:
         解析后的会话列表
     """
-    sessions = []
-
     # 如果已经是列表格式（新的配置格式）
     if isinstance(sessions_data, list):
-        sessions = [s.strip() for s in sessions_data if s and s.strip()]
-        return sessions
+        return _strip_items(sessions_data)
 
-    # 如果是字符串格式（兼容旧配置）
+    # 如果是字符串格式（兼容旧配置，支持 JSON 和换行格式）
     if isinstance(sessions_data, str):
-        try:
-            # 尝试解析JSON格式
-            sessions = json.loads(sessions_data)
-            if not isinstance(sessions, list):
-                raise ValueError("不是有效的JSON数组")
-            # 过滤空字符串
-            sessions = [s.strip() for s in sessions if s and s.strip()]
-        except (json.JSONDecodeError, ValueError):
-            # 回退到传统换行格式
-            sessions = [s.strip() for s in sessions_data.split("\n") if s.strip()]
+        return _parse_text_list(sessions_data)
 
-    return sessions
+    return []
 
 
 def parse_prompt_list(prompt_list_data) -> list:
@@ -54,35 +70,12 @@ def parse_prompt_list(prompt_list_data) -> list:
     try:
         # 如果已经是列表格式（新的配置格式）
         if isinstance(prompt_list_data, list):
-            prompt_list = [
-                str(item).strip()
-                for item in prompt_list_data
-                if item and str(item).strip()
-            ]
-            return prompt_list
+            return _strip_items(prompt_list_data)
 
         # 如果是字符串格式（兼容旧配置）
         if isinstance(prompt_list_data, str):
-            try:
-                # 尝试解析JSON格式
-                parsed_list = json.loads(prompt_list_data)
-                if not isinstance(parsed_list, list):
-                    raise ValueError("不是有效的JSON数组")
-
-                # 过滤空字符串
-                prompt_list = [
-                    str(item).strip()
-                    for item in parsed_list
-                    if item and str(item).strip()
-                ]
-
-            except (json.JSONDecodeError, ValueError):
-                # 回退到传统换行格式
-                prompt_list = [
-                    line.strip()
-                    for line in prompt_list_data.split("\n")
-                    if line.strip()
-                ]
+            # 兼容 JSON 和传统换行格式；结果已逐项去除空白并过滤空项
+            prompt_list = _parse_text_list(prompt_list_data)
 
     except Exception as e:
         logger.error(f"心念 | ❌ 解析提示词列表失败: {e}")
@@ -91,12 +84,4 @@ def parse_prompt_list(prompt_list_data) -> list:
         logger.error(f"心念 | 详细错误信息: {traceback.format_exc()}")
         return []
 
-    # 最终检查，确保所有提示词都是有效的
-    valid_prompts = []
-    for prompt in prompt_list:
-        if prompt and len(prompt.strip()) > 0:
-            valid_prompts.append(prompt)
-        else:
-            logger.warning(f"心念 | ⚠️ 跳过无效的提示词: {repr(prompt)}")
-
-    return valid_prompts
+    return prompt_list
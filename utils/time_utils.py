@@ -5,6 +5,11 @@
 """
 
 import datetime
+import functools
+import math
+import re
+import time
+from typing import Optional
 from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
 from astrbot.api import logger
 
@@ -93,6 +98,79 @@ def get_now(config: dict, astrbot_config=None) -> datetime.datetime:
     return datetime.datetime.now()
 
 
+# format_now 的缓存：(秒级时间戳, 时区, 格式) -> 格式化结果
+# 同一秒内不同格式（如用户自定义格式与默认格式）交替调用时也能命中
+_NOW_TEXT_CACHE_MAX = 16
+_now_text_cache: dict[tuple, str] = {}
+
+
+def format_now(
+    config: dict, astrbot_config=None, time_format: str = "%Y-%m-%d %H:%M:%S"
+) -> str:
+    """获取格式化后的当前时间字符串（按秒缓存）
+
+    同一秒内使用相同时区与格式的重复调用直接复用上次结果，避免重复 strftime。
+
+    Args:
+        config: 插件配置字典
+        astrbot_config: AstrBot 全局配置对象（可选）
+        time_format: strftime 格式
+
+    Returns:
+        格式化后的当前时间
+    """
+    tz = get_tz(config, astrbot_config)
+    key = (int(time.time()), tz, time_format)
+    text = _now_text_cache.get(key)
+    if text is not None:
+        return text
+
+    now = datetime.datetime.now(tz=tz) if tz is not None else datetime.datetime.now()
+    text = now.strftime(time_format)
+    if len(_now_text_cache) >= _NOW_TEXT_CACHE_MAX:
+        _now_text_cache.clear()
+    _now_text_cache[key] = text
+    return text
+
+
+# "HH:MM-HH:MM"，各段允许前后空白，分钟可为一位
+_TIME_RANGE_RE = re.compile(
+    r"^\s*(\d{1,2})\s*:\s*(\d{1,2})\s*-\s*(\d{1,2})\s*:\s*(\d{1,2})\s*$"
+)
+
+
+@functools.lru_cache(maxsize=32)
+def parse_time_range(time_range: str) -> Optional[tuple[int, int]]:
+    """解析时间范围字符串为（开始分钟, 结束分钟）
+
+    结果按字符串缓存，配置不变时每次检查只需整数比较。
+
+    Args:
+        time_range: 时间范围字符串，格式为 "HH:MM-HH:MM"
+
+    Returns:
+        (start_minutes, end_minutes)，解析失败返回 None
+    """
+    match = _TIME_RANGE_RE.match(time_range) if isinstance(time_range, str) else None
+    if match is None:
+        logger.warning(f"心念 | ⚠️ 时间范围解析错误: {time_range!r}")
+        return None
+    start_hour, start_min, end_hour, end_min = map(int, match.groups())
+    return start_hour * 60 + start_min, end_hour * 60 + end_min
+
+
+def _current_minute_of_day(tz=None) -> int:
+    """获取当前时间是一天中的第几分钟
+
+    未指定时区时使用 time.localtime()，避免仅为取时分而构造 datetime 对象。
+    """
+    if tz is None:
+        lt = time.localtime()
+        return lt.tm_hour * 60 + lt.tm_min
+    now = datetime.datetime.now(tz=tz)
+    return now.hour * 60 + now.minute
+
+
 def is_in_time_range(time_range: str, tz=None) -> bool:
     """检查当前时间是否在指定的时间范围内
 
@@ -105,28 +183,26 @@ def is_in_time_range(time_range: str, tz=None) -> bool:
     Returns:
         True 如果当前时间在范围内，False 否则
     """
-    try:
-        start_time, end_time = time_range.split("-")
-        start_hour, start_min = map(int, start_time.split(":"))
-        end_hour, end_min = map(int, end_time.split(":"))
-
-        now = (
-            datetime.datetime.now(tz=tz) if tz is not None else datetime.datetime.now()
-        )
-        current_minutes = now.hour * 60 + now.minute
-        start_minutes = start_hour * 60 + start_min
-        end_minutes = end_hour * 60 + end_min
-
-        # 处理跨午夜的时间段（如 22:00-8:00）
-        if start_minutes > end_minutes:
-            # 跨午夜：当前时间在开始时间之后 或 在结束时间之前
-            return current_minutes >= start_minutes or current_minutes <= end_minutes
-        else:
-            # 不跨午夜：当前时间在开始和结束之间
-            return start_minutes <= current_minutes <= end_minutes
-    except Exception as e:
-        logger.warning(f"心念 | ⚠️ 时间范围解析错误: {e}")
+    parsed = parse_time_range(time_range)
+    if parsed is None:
         return False
+    start_minutes, end_minutes = parsed
+
+    # 覆盖全天的范围（如 "0:00-23:59"、"8:00-7:59"）无需读取当前时间
+    if start_minutes > end_minutes:
+        if start_minutes <= end_minutes + 1:
+            return True
+    elif start_minutes == 0 and end_minutes >= 23 * 60 + 59:
+        return True
+
+    current_minutes = _current_minute_of_day(tz)
+
+    # 处理跨午夜的时间段（如 22:00-8:00）
+    if start_minutes > end_minutes:
+        # 跨午夜：当前时间在开始时间之后 或 在结束时间之前
+        return current_minutes >= start_minutes or current_minutes <= end_minutes
+    # 不跨午夜：当前时间在开始和结束之间
+    return start_minutes <= current_minutes <= end_minutes
 
 
 def is_sleep_time(config: dict, astrbot_config=None) -> bool:
@@ -176,8 +252,8 @@ def get_seconds_until_sleep_end(config: dict, astrbot_config=None) -> int:
         return 0
 
     try:
-        _, end_time = sleep_hours.split("-")
-        end_hour, end_min = map(int, end_time.split(":"))
+        _, end_minutes = parse_time_range(sleep_hours)
+        end_hour, end_min = divmod(end_minutes, 60)
 
         now = (
             datetime.datetime.now(tz=tz) if tz is not None else datetime.datetime.now()
@@ -202,6 +278,42 @@ def get_seconds_until_sleep_end(config: dict, astrbot_config=None) -> int:
         return 0
 
 
+def get_seconds_until_sleep_start(config: dict, astrbot_config=None) -> Optional[int]:
+    """计算到下一次进入睡眠时间的秒数
+
+    Args:
+        config: 插件配置字典
+        astrbot_config: AstrBot 全局配置对象（可选）
+
+    Returns:
+        到睡眠开始的秒数；未启用睡眠模式、当前已在睡眠时间或配置无效时返回 None
+    """
+    time_awareness_config = config.get("time_awareness", {})
+    if not time_awareness_config.get("sleep_mode_enabled", False):
+        return None
+
+    sleep_hours = time_awareness_config.get("sleep_hours", "22:00-8:00")
+    parsed = parse_time_range(sleep_hours)
+    if parsed is None:
+        return None
+
+    tz = get_tz(config, astrbot_config)
+    if is_in_time_range(sleep_hours, tz=tz):
+        return None
+
+    # parse_time_range 接受 "24:00" 等超出一天的写法，先折回当天分钟数，
+    # 避免 datetime.replace(hour=24) 抛出 ValueError 导致主循环反复出错
+    start_hour, start_min = divmod(parsed[0] % (24 * 60), 60)
+    now = datetime.datetime.now(tz=tz) if tz is not None else datetime.datetime.now()
+    start_datetime = now.replace(
+        hour=start_hour, minute=start_min, second=0, microsecond=0
+    )
+    if start_datetime <= now:
+        start_datetime += datetime.timedelta(days=1)
+
+    return max(1, math.ceil((start_datetime - now).total_seconds()))
+
+
 def get_sleep_prompt_if_active(config: dict, astrbot_config=None) -> str:
     """获取睡眠时间提示（如果当前处于睡眠时间）
 
@@ -6,6 +6,19 @@
 
 from astrbot.api import logger
 
+# 旧扁平格式中必须存在且为字典的顶层键
+_LEGACY_DICT_KEYS = (
+    "session_user_info",
+    "ai_last_sent_times",
+    "last_sent_times",
+    "session_next_fire_times",
+    "session_sleep_remaining",
+    "session_last_proactive_message",
+    "session_unreplied_count",
+    "session_consecutive_failures",
+    "session_ai_scheduled",
+)
+
 
 def validate_persistent_data(data: dict) -> bool:
     """验证持久化数据结构
@@ -48,22 +61,12 @@ def validate_persistent_data(data: dict) -> bool:
         return True
 
     # 旧的扁平格式（向后兼容）
-    dict_keys = [
-        "session_user_info",
-        "ai_last_sent_times",
-        "last_sent_times",
-        "session_next_fire_times",
-        "session_sleep_remaining",
-        "session_last_proactive_message",
-        "session_unreplied_count",
-        "session_consecutive_failures",
-        "session_ai_scheduled",
-    ]
+    missing = [key for key in _LEGACY_DICT_KEYS if key not in data]
+    if missing:
+        logger.error(f"心念 | ❌ 持久化数据缺少必需键: {', '.join(missing)}")
+        return False
 
-    for key in dict_keys:
-        if key not in data:
-            logger.error(f"心念 | ❌ 持久化数据缺少必需键: {key}")
-            return False
+    for key in _LEGACY_DICT_KEYS:
         if not isinstance(data[key], dict):
             logger.error(
                 f"心念 | ❌ 持久化数据键 {key} 应为字典类型，实际为 {type(data[key]).__name__}"